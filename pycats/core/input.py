@@ -3,6 +3,7 @@
 # Pygame-free input port: `InputFrame` (the per-frame edge-aware key snapshot) and
 # `merge_frames`. The framework-touching `poll()` lives in `pycats/shell/input_poll.py`
 # (present layer) — see ADR-0004 / decision #9 (#318).
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 
 #### TODO: research how key buffering is typically done for fighting games
@@ -11,11 +12,17 @@ from dataclasses import dataclass
 # that can be buffered for a short time
 
 
-@dataclass
+@dataclass(slots=True)
 class InputFrame:
-    held: set[int]  # keys held down this frame
-    pressed: set[int]  # keys that went down THIS frame, i.e. "just pressed"
-    released: set[int]  # keys that were up THIS frame, i.e. "just released"
+    """One frame's key snapshot. Constructible positionally ``(held, pressed, released)``;
+    the fields are only ever read (``in`` / iteration / union), so any set type works —
+    callers replaying a fixed input may pre-build one frame from frozensets and reuse it.
+    Slotted: the update path reads these three fields many times per frame, and a
+    slotted instance carries no ``__dict__``."""
+
+    held: AbstractSet[int]  # keys held down this frame
+    pressed: AbstractSet[int]  # keys that went down THIS frame, i.e. "just pressed"
+    released: AbstractSet[int]  # keys that were up THIS frame, i.e. "just released"
     # buffered: set[int]   # keys pressed in the last N frames
 
     # to string method
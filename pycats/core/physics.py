@@ -260,6 +260,31 @@ def find_current_platform(actor_rect: pg.Rect, platforms):
     return None
 
 
+def find_platform_below(actor_rect: pg.Rect, platforms):
+    """
+    Find the platform the actor would land on by falling straight down.
+
+    Args:
+        actor_rect: Current position of the actor
+        platforms: List of all platforms
+
+    Returns:
+        The x-overlapping platform with the highest top at or below the actor's
+        feet, or None if there is nothing underneath
+    """
+    below = None
+    for platform in platforms:
+        platform_rect = platform.rect
+        if (
+            platform_rect.top >= actor_rect.bottom
+            and actor_rect.right > platform_rect.left
+            and actor_rect.left < platform_rect.right
+            and (below is None or platform_rect.top < below.rect.top)
+        ):
+            below = platform
+    return below
+
+
 def would_dodge_off_platform(actor_rect: pg.Rect, dodge_velocity: float, current_platform) -> bool:
     """
     Check if a dodge with the given velocity would take the actor off their current platform.
@@ -520,6 +520,16 @@ class Fighter:
         if not was_airborne and not self.on_ground:
             self.jumps_remaining = min(self.jumps_remaining, self.max_jumps - 1)
 
+    def land_at(self, top) -> bool:
+        """Stand the fighter's feet on `top` (vel.y zeroed, on_ground set) and resolve
+        the landing exactly as step_physics does. Returns the _handle_landing knockdown
+        flag for the caller to apply."""
+        was_airborne = not self.on_ground
+        self.rect = self.rect.with_bottom(top)
+        self.vel.y = 0
+        self.on_ground = True
+        return self._handle_landing(was_airborne)
+
     # ============================================================= KO / respawn
     def _outside_blast_zone(self) -> bool:
         # Horizontal (left/right) uses the wider BLAST_PADDING_X (#733, temporary
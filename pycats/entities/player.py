@@ -68,7 +68,7 @@ from .ledge import ledge_regrab_intangible_frames
 _FSMASH_ANGLE = {"up": FSMASH_ANGLE_UP, "down": FSMASH_ANGLE_DOWN}
 from ..combat.knockback import decay_velocity
 from ..combat.move_clock import MoveClock
-from ..core.physics import apply_horizontal_friction
+from ..core.physics import apply_horizontal_friction, find_platform_below
 from ..systems.state_engine import make_state_engine
 
 # Downward vy applied when leaving the ledge (eviction / drop) so the fighter reads as
@@ -76,6 +76,18 @@ from ..systems.state_engine import make_state_engine
 _LEDGE_DROP_NUDGE_VY = 1
 
 
+class _DiscardSpawns:
+    """The attack_group stand-in when `Player.update` gets None: spawns are dropped."""
+
+    __slots__ = ()
+
+    def add(self, *sprites):
+        pass
+
+
+_NO_SPAWNS = _DiscardSpawns()
+
+
 class PState(Enum):
     IDLE = auto()
     #### TODO: implement walk state
@@ -259,6 +271,34 @@ class Player(pygame.sprite.Sprite):
         self._landing_spawn_now = None
         self.tail.reset()  # re-lay the tail at the spawn point (#41)
 
+    def reset(self, x, y) -> None:
+        """Re-seat this player at (x, y) in a clean idle state, reusing the instance.
+
+        Moves the spawn point, runs the same per-life reset as a respawn
+        (reset_to_spawn), then forces the engine to idle — so a caller replaying
+        many short scenarios can reuse one Player instead of rebuilding its fighter
+        data, statechart and tail each time. Match-scoped fields (lives, stats) are
+        left alone, as with reset_to_spawn."""
+        self.fighter.spawn_point.update(x, y)
+        self.reset_to_spawn()
+        self.engine.force("idle")
+
+    def snap_to_ground(self, platforms) -> bool:
+        """Stand the fighter on the platform straight below it in one step, idle.
+
+        A setup shortcut for tests and tools: instead of ticking fall frames through
+        the full update (engine + collision) until the fighter lands, place its feet
+        on the nearest platform top below, run the normal landing bookkeeping
+        (jumps / air dodge restored), re-lay the tail and force the engine to idle.
+        Returns False, leaving the fighter untouched, when nothing is below."""
+        platform = find_platform_below(self.rect, platforms)
+        if platform is None:
+            return False
+        self.fighter.land_at(platform.rect.top)
+        self.tail.reset()
+        self.engine.force("idle")
+        return True
+
     # ---- move-progress, delegated to MoveClock (#71) ----
     # These three are read by the statechart (fighter_chart) and the runner
     # snapshot; keeping the historical names/values means no consumer changes and
@@ -320,11 +360,15 @@ class Player(pygame.sprite.Sprite):
     # move clock, not from Fighter, so they stay.)
 
     # ============================================================== update
-    def update(self, input_frame, platforms, attack_group, ledges=()):
+    def update(self, input_frame, platforms, attack_group=None, ledges=()):
         """Master per-frame update: KO/respawn + freeze guards, then the usual phase
         sequence (shield/actions/ledge-hang/physics/ledge-grab/timers/spawn/FSM/posture).
 
-        Each phase is its own helper; the early guards return before any of them run."""
+        Each phase is its own helper; the early guards return before any of them run.
+        `attack_group` only receives spawned hitboxes/projectiles (`.add`); None
+        drops them, for callers with no attack list (tests, tools)."""
+        if attack_group is None:
+            attack_group = _NO_SPAWNS
         held = input_frame.held
         pressed = input_frame.pressed
 
@@ -353,6 +397,16 @@ class Player(pygame.sprite.Sprite):
         # state label so the geometry stays byte-identical (golden-stable).
         self._apply_posture_geometry()
 
+    def update_n(self, input_frame, platforms, n, attack_group=None, ledges=()):
+        """Run ``n`` consecutive fixed-step `update` ticks with one unchanging input.
+
+        Same result as calling `update` ``n`` times (each tick is a full frame — no
+        sub-stepping shortcut); the loop just binds the method once, for callers that
+        replay a held input (tests, scripted sims) and only inspect the end state."""
+        update = self.update
+        for _ in range(n):
+            update(input_frame, platforms, attack_group, ledges)
+
     def _handle_death_and_freezes(self):
         """Dead/respawn, hitlag freeze (#138), and blast-zone KO early-outs.
 
@@ -28,6 +28,7 @@ import pygame  # type: ignore
 
 from .shell.app import P1_KEYS, P2_KEYS, App
 from .storage import keybind_store, runtime_settings, settings
+from .ui.text_utils import text_renderer
 
 
 def parse_args(argv):
@@ -97,6 +98,14 @@ def main():
     # reason as settings.load: App construction does zero file I/O (#707 Q2).
     keybind_store.load_last_used(P1_KEYS, P2_KEYS)
 
+    # Reuse the Unicode-font detection saved by an earlier launch (font_detect_cache).
+    # Opted in here, not at import: the import-time renderer stays I/O-free, so tests
+    # and tools never read or write the user's cache. Resolved now, before App opens the
+    # window: the probe's per-font SysFont loads take the fontconfig path that hard-hangs
+    # once a display is up (#375), and the first frame shouldn't stall on the sweep.
+    text_renderer.persist_detection = True
+    text_renderer.font_info  # touch: runs detection (or the cache read) eagerly
+
     app = App(prefs=prefs, speed=args.speed)
     while app.running:
         app.step()
@@ -103,6 +103,33 @@ DEV_KEY_NAMES = {"default": "Default", "testcat": "Test"}
 class CharacterSelector:
     """Handles character selection screen logic for both players."""
 
+    # Fixed attribute set: no per-instance __dict__, and the per-frame render path's
+    # `self.*` reads (cursors, grid origin, confirm state) are slot-offset loads.
+    __slots__ = (
+        "characters",
+        "p1_cursor",
+        "p2_cursor",
+        "p1_selected",
+        "p2_selected",
+        "p1_palette",
+        "p2_palette",
+        "p1_confirmed",
+        "p2_confirmed",
+        "p1_confirm_seq",
+        "p2_confirm_seq",
+        "_next_confirm_seq",
+        "show_start_screen",
+        "start_screen_delay",
+        "p1_controls",
+        "p2_controls",
+        "p1_input_cooldown",
+        "p2_input_cooldown",
+        "grid_start_x",
+        "grid_start_y",
+        "_grid_surf",
+        "_char_data",
+    )
+
     def __init__(self, p1_controls, p2_controls):
         # The roster is the real PM-archetype fighters (#268, #127 Part 1), not the
         # OG colour-skins; each archetype's cosmetic comes from its default palette.
@@ -113,6 +140,9 @@ class CharacterSelector:
         # build → the roster is byte-identical to ARCHETYPE_ROSTER (no player-visible change).
         if runtime_settings.dev_mode():
             self.characters += list(DEV_ROSTER)
+        # Each roster tile's default-Skin palette, resolved once (parallel to `characters`):
+        # the grid repaints every tile's preview every frame from these.
+        self._char_data = [palette_for(k) for k in self.characters]
 
         # Player cursors (grid positions)
         self.p1_cursor = 0  # grid index
@@ -156,6 +186,9 @@ class CharacterSelector:
             - (CHAR_SELECT_GRID_COLS * CHAR_SELECT_TILE_SIZE + (CHAR_SELECT_GRID_COLS - 1) * CHAR_SELECT_TILE_SPACING)
         ) // 2
         self.grid_start_y = GRID_START_Y  # Below title
+        # Pre-stamped tile backdrop (fills + borders for every roster tile), built on first
+        # render — the roster is fixed for the selector's lifetime, so it never goes stale.
+        self._grid_surf = None
 
     def reset(self):
         """Reset the character selector to initial state."""
@@ -473,10 +506,34 @@ class CharacterSelector:
 
         return x, y
 
-    def _draw_cat_preview(self, screen, char_key, x, y, size, palette_key=None):
-        """Draw a small cat preview in the given tile. ``palette_key`` overrides the
-        archetype default with a chosen OG skin (live skin preview, #650)."""
-        char_data = palette_for(palette_key or char_key)  # chosen skin → archetype default
+    def _grid_backdrop(self):
+        """The roster grid's tile fills + 1px borders stamped once onto one surface, so
+        `render` paints every tile background with a single blit instead of two
+        ``draw.rect`` calls per tile. Gaps (and empty trailing cells) are the screen
+        background colour, so the blit is indistinguishable from the per-tile draws."""
+        if self._grid_surf is None:
+            rows = -(-len(self.characters) // CHAR_SELECT_GRID_COLS)
+            cols = min(len(self.characters), CHAR_SELECT_GRID_COLS)
+            step = CHAR_SELECT_TILE_SIZE + CHAR_SELECT_TILE_SPACING
+            surf = pygame.Surface((cols * step - CHAR_SELECT_TILE_SPACING, rows * step - CHAR_SELECT_TILE_SPACING))
+            surf.fill(CHAR_SELECT_BG_COLOR)
+            for i in range(len(self.characters)):
+                x, y = self._grid_pos_to_screen_pos(i)
+                tile_rect = pygame.Rect(
+                    x - self.grid_start_x, y - self.grid_start_y, CHAR_SELECT_TILE_SIZE, CHAR_SELECT_TILE_SIZE
+                )
+                pygame.draw.rect(surf, TILE_BG_COLOR, tile_rect)
+                pygame.draw.rect(surf, WHITE, tile_rect, 1)
+            self._grid_surf = surf
+        return self._grid_surf
+
+    def _draw_cat_preview(self, screen, char_data, x, y, size):
+        """Draw a small cat preview in the given tile from a resolved palette ``char_data``
+        (a roster tile's cached default, or a player slot's chosen skin — live skin
+        preview, #650)."""
+        color = char_data["color"]
+        stripe_color = char_data["stripe_color"]
+        eye_color = char_data["eye_color"]
 
         # Scale down for preview
         preview_size = (size * PREVIEW_SCALE_X, size * PREVIEW_SCALE_Y)
@@ -487,16 +544,17 @@ class CharacterSelector:
             preview_size[1],
         )
 
-        # Draw body
-        pygame.draw.rect(screen, char_data["color"], cat_rect)
+        # Draw body — solid axis-aligned fills go through Surface.fill (a straight SDL
+        # fill-rect), skipping draw.rect's outline/width handling.
+        screen.fill(color, cat_rect)
 
         # Draw stripes (simplified)
-        if char_data["stripe_color"] != char_data["color"]:
+        if stripe_color != color:
             stripe_height = preview_size[1] // 6
             for i in range(PREVIEW_STRIPE_COUNT):
                 stripe_y = cat_rect.y + i * stripe_height * 2
                 stripe_rect = pygame.Rect(cat_rect.x, stripe_y, preview_size[0], stripe_height)
-                pygame.draw.rect(screen, char_data["stripe_color"], stripe_rect)
+                screen.fill(stripe_color, stripe_rect)
 
         # Draw ears
         ear_width = preview_size[0] // 6
@@ -513,8 +571,8 @@ class CharacterSelector:
             ear_width,
             ear_height,
         )
-        pygame.draw.rect(screen, char_data["color"], left_ear)
-        pygame.draw.rect(screen, char_data["color"], right_ear)
+        screen.fill(color, left_ear)
+        screen.fill(color, right_ear)
 
         # Draw eyes
         eye_size = max(2, int(preview_size[0] // PREVIEW_EYE_DIVISOR))
@@ -527,8 +585,8 @@ class CharacterSelector:
             cat_rect.y + preview_size[1] // 4,
         )
 
-        pygame.draw.circle(screen, char_data["eye_color"], left_eye_pos, eye_size)
-        pygame.draw.circle(screen, char_data["eye_color"], right_eye_pos, eye_size)
+        pygame.draw.circle(screen, eye_color, left_eye_pos, eye_size)
+        pygame.draw.circle(screen, eye_color, right_eye_pos, eye_size)
 
         # Draw eye glints
         glint_size = max(1, eye_size // 2)
@@ -568,19 +626,15 @@ class CharacterSelector:
                     center=True,
                 )
 
-        # Character grid
-        for i, char_key in enumerate(self.characters):
+        # Character grid — every tile background + border in one blit of the cached backdrop
+        screen.blit(self._grid_backdrop(), (self.grid_start_x, self.grid_start_y))
+        for i, (char_key, char_data) in enumerate(zip(self.characters, self._char_data)):
             x, y = self._grid_pos_to_screen_pos(i)
 
-            # Draw tile background
-            tile_rect = pygame.Rect(x, y, CHAR_SELECT_TILE_SIZE, CHAR_SELECT_TILE_SIZE)
-            pygame.draw.rect(screen, TILE_BG_COLOR, tile_rect)
-            pygame.draw.rect(screen, WHITE, tile_rect, 1)
-
             # Draw cat preview — a Character Roster Tile ALWAYS paints the Character's default
             # Skin (#761). A player's cycled Skin shows only in their Player Choice Slot below,
             # so two players can hold one Character in different Skins without the tile clashing.
-            self._draw_cat_preview(screen, char_key, x, y, CHAR_SELECT_TILE_SIZE)
+            self._draw_cat_preview(screen, char_data, x, y, CHAR_SELECT_TILE_SIZE)
 
             # Draw character name
             text_utils.render_text(
@@ -670,8 +724,8 @@ class CharacterSelector:
 
     def _draw_player_slots(self, screen):
         """Render the fixed P1..P4 selected-character display row (#682): each active player's
-        slot paints their selected Character in the currently-cycled Skin (via
-        `_draw_cat_preview`'s ``palette_key``), live; P3/P4 are inert stubs since 4-player
+        slot paints their selected Character in the currently-cycled Skin (its palette
+        passed to `_draw_cat_preview`), live; P3/P4 are inert stubs since 4-player
         support does not exist yet. Separate from the selection grid and from the #662
         confirmation preview."""
         # (selected, palette_key, confirmed, accent, tag) per real player; None-padded to P4.
@@ -688,10 +742,11 @@ class CharacterSelector:
             if active and players[slot][2] and players[slot][0]:
                 # confirmed on a Character → paint the cat in the chosen Skin
                 selected, palette, _confirmed, accent = players[slot]
+                skin_data = palette_for(palette or selected)  # chosen skin → archetype default
                 pygame.draw.rect(screen, TILE_BG_COLOR, rect)
-                self._draw_cat_preview(screen, selected, x, y, size, palette_key=palette)
+                self._draw_cat_preview(screen, skin_data, x, y, size)
                 pygame.draw.rect(screen, accent, rect, 3)
-                skin = palette_for(palette or selected)["name"]
+                skin = skin_data["name"]
                 caption, cap_color, tag_color = f"{self._tile_name(selected)} - {skin}", WHITE, accent
             elif active:
                 # real player, not yet locked in
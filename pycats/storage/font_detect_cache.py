@@ -0,0 +1,68 @@
+# pycats/storage/font_detect_cache.py
+#
+# Persisted result of TextRenderer's Unicode-font detection. Detection probes every
+# candidate system font (a SysFont load + a render per test glyph) on each launch, but
+# its answer only changes when the installed fonts do — so it is saved as JSON under
+# the #95 config dir, keyed by a digest of the installed-font list, and reused while
+# that digest still matches. Pure I/O + serialization; no font work happens here.
+# Honors the PYCATS_CONFIG_DIR redirect and the PYCATS_NO_PERSIST kill-switch (#95).
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from . import settings
+
+
+def _store_path():
+    return os.path.join(settings._config_dir(), "cache", "font_detect.json")
+
+
+def fonts_key(fonts, *salt) -> str:
+    """Stable digest of the installed-font list plus any `salt` (probe size, pygame
+    version, ...). hashlib, not hash(): str hashes are salted per process, so a
+    hash()-based key would never match on the next launch."""
+    payload = json.dumps([sorted(fonts), *salt], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load(key):
+    """``(hit, result)`` for `key`. `result` is the detection dict (``name`` +
+    ``supported_chars`` as a set) or None (no usable font). Missing / corrupt /
+    stale-key / persistence-disabled -> ``(False, None)`` (no crash)."""
+    if settings._persist_disabled():
+        return False, None
+    try:
+        with open(_store_path(), encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (FileNotFoundError, ValueError, OSError):
+        return False, None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return False, None
+    result = data.get("result")
+    if result is None:
+        return True, None
+    if not isinstance(result, dict) or not isinstance(result.get("supported_chars"), list):
+        return False, None
+    return True, {"name": result.get("name"), "supported_chars": set(result["supported_chars"])}
+
+
+def save(key, result):
+    """Persist `result` (a detection dict or None) under `key`, replacing any older
+    entry. Written to a temp file then renamed, so a concurrent reader (parallel test
+    processes) never sees a half-written file. No-op when persistence is disabled or
+    the config dir is unwritable (no crash)."""
+    if settings._persist_disabled():
+        return
+    if result is not None:
+        result = {"name": result["name"], "supported_chars": sorted(result["supported_chars"])}
+    path = _store_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"key": key, "result": result}, fh, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        return  # unwritable config dir: detection just reruns next launch
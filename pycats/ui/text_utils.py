@@ -7,18 +7,79 @@ This module provides:
 - Consistent text rendering across different screens
 """
 
+import weakref
 from collections import OrderedDict
+from typing import NamedTuple
 
 import pygame
 
 from ..config import TEXT_PROBE_SIZE  # font-probe size: single font-size source (#344)
-from ..storage import runtime_settings  # live font_scale multiplier (#345)
+from ..storage import (
+    font_detect_cache,  # detection result persisted across launches
+    runtime_settings,  # live font_scale multiplier (#345)
+)
+
+# ASCII stand-ins for the Unicode symbols the UI uses, for fonts that can't draw them.
+# Built once at import, so _get_ascii_fallback is a single dict lookup per char.
+_ASCII_FALLBACKS = {
+    "►": ">",
+    "▶": ">",  # U+25B6, the black-triangle twin of ► (#547)
+    "◄": "<",
+    "↑": "^",
+    "↓": "v",
+    "→": ">",
+    "←": "<",
+    "✓": "OK",
+    "✗": "X",
+    "☑": "[v]",
+    "☐": "[ ]",
+}
+
+# The UI's arrows and check mark: the Unicode-font probe set, and the chars a legacy
+# font name is trusted with. _ARROW_CHARS (no check mark) get the small vertical
+# nudge in render_unicode_char / _compose_mixed. Emoji are probed only as a fallback.
+_BASIC_PROBE_CHARS = ("►", "◄", "↑", "↓", "✓", "→", "←")
+_ARROW_CHARS = ("►", "◄", "↑", "↓", "→", "←")
+_EMOJI_PROBE_CHARS = ("🐱", "🐈", "😸")
+# Trusted sets for the legacy bare-name config (see _font_info), and the empty set
+# used when no Unicode font is available. Frozen: shared by every FontInfo/call.
+_LEGACY_DEFAULT_CHARS = frozenset(_BASIC_PROBE_CHARS + _EMOJI_PROBE_CHARS)
+_LEGACY_NAMED_CHARS = frozenset(_BASIC_PROBE_CHARS)
+_NO_CHARS = frozenset()
+
+
+class FontInfo(NamedTuple):
+    """The Unicode font in use: ``name`` ("default" = pygame's built-in font) and the
+    characters it is trusted to draw. `TextRenderer.font_info` is None without one."""
+
+    name: str
+    supported_chars: frozenset[str]
+
+
+# TextRenderer.unicode_font_name before the first (lazy) detection; None is a result.
+_UNDETECTED = object()
+
+
+def _font_info(unicode_font_name):
+    """Normalise a stored detection result to a `FontInfo` (or None).
+
+    Detection and the persisted cache produce a ``{"name", "supported_chars"}`` dict
+    or None; a bare font-name string is the legacy form, trusted with the basic set
+    (plus emoji for the built-in "default" font). ``supported_chars`` is frozen once
+    here, so it is immutable and hashable wherever the render paths pass it."""
+    if not unicode_font_name:
+        return None
+    if isinstance(unicode_font_name, dict):
+        return FontInfo(unicode_font_name["name"], frozenset(unicode_font_name["supported_chars"]))
+    if unicode_font_name == "default":
+        return FontInfo("default", _LEGACY_DEFAULT_CHARS)  # Assume basic set works
+    return FontInfo(unicode_font_name, _LEGACY_NAMED_CHARS)  # Conservative assumption
 
 
 class TextRenderer:
     """Utility class for rendering text with mixed font support."""
 
-    def __init__(self, run_diagnostics=False):
+    def __init__(self, run_diagnostics=False, persist_detection=False):
         # Ensure pygame font system is initialized
         if not pygame.font.get_init():
             pygame.font.init()
@@ -55,11 +116,59 @@ class TextRenderer:
         self.simple_cache_misses = 0
         self._SIMPLE_CACHE_CAP = 1024  # cap; LRU-evict oldest when dynamic text grows it
 
+        # Per-font missing-glyph ("\ue000") width: _can_font_render_char compares every
+        # probed char against it, and it re-rasterised the missing glyph on every call.
+        # Weak-keyed on the Font object so the short-lived probe fonts drop their entry
+        # with them (an id() key could be reused).
+        self._missing_glyph_width = weakref.WeakKeyDictionary()
+
+        # Detection runs on first use, not here: the module-level instance is built at
+        # import, and the probe sweep (or the persisted-result read, when
+        # persist_detection) must not run for a bare `import` (tests, tooling).
+        # game.main() turns persistence on for the shipped process.
+        self.persist_detection = persist_detection
+        self._unicode_font_name = _UNDETECTED
+        self._font_info = None
+
         # Run diagnostic test if requested
         if run_diagnostics:
             self.test_font_capabilities()
 
-        self.unicode_font_name = self._find_unicode_font()
+    @property
+    def unicode_font_name(self):
+        """The detection result as stored: a ``{"name", "supported_chars"}`` dict, a
+        legacy bare font name, or None. Assigning it re-derives `font_info`, so the
+        render paths read one normalised `FontInfo` instead of re-checking the form, and
+        drops the composed mixed surfaces, which were built with the previous font."""
+        if self._unicode_font_name is _UNDETECTED:
+            self.unicode_font_name = self._detect_unicode_font(self.persist_detection)
+        return self._unicode_font_name
+
+    @unicode_font_name.setter
+    def unicode_font_name(self, value):
+        self._unicode_font_name = value
+        self._font_info = _font_info(value)
+        self._mixed_surface_cache.clear()
+
+    @property
+    def font_info(self):
+        """The normalised `FontInfo` for `unicode_font_name` (None without a font)."""
+        if self._unicode_font_name is _UNDETECTED:
+            self.unicode_font_name = self._detect_unicode_font(self.persist_detection)
+        return self._font_info
+
+    def _detect_unicode_font(self, persist):
+        """_find_unicode_font, reusing the result saved by an earlier launch (when
+        `persist`) while the installed-font list is unchanged — the probe sweep loads
+        and rasterises every candidate font, the cached answer is one JSON read."""
+        if not persist:
+            return self._find_unicode_font()
+        key = font_detect_cache.fonts_key(pygame.font.get_fonts(), TEXT_PROBE_SIZE, pygame.version.ver)
+        hit, found = font_detect_cache.load(key)
+        if not hit:
+            found = self._find_unicode_font()
+            font_detect_cache.save(key, found)
+        return found
 
     def _find_unicode_font(self):
         """Find the best available Unicode font."""
@@ -70,8 +179,8 @@ class TextRenderer:
         available_fonts = pygame.font.get_fonts()
 
         # Test with two sets: basic arrows/symbols (small) and emoji (can be large)
-        basic_chars = ["►", "◄", "↑", "↓", "✓", "→", "←"]
-        emoji_chars = ["🐱", "🐈", "😸"]
+        basic_chars = _BASIC_PROBE_CHARS
+        emoji_chars = _EMOJI_PROBE_CHARS
 
         # First try fonts that we know exist on this system
         symbol_fonts = [font for font in available_fonts if "symbol" in font.lower()]
@@ -216,15 +325,17 @@ class TextRenderer:
                     return False
 
             # For arrow/symbol characters, expect reasonable width
-            elif char in ["►", "◄", "↑", "↓", "✓", "→", "←"]:
+            elif char in _BASIC_PROBE_CHARS:
                 if char_width < 3:
                     return False
 
             # Test by comparing against known missing character
             try:
-                # Render a character that definitely doesn't exist
-                missing_char = font.render("\ue000", True, (255, 255, 255))  # Private use area
-                missing_width = missing_char.get_width()
+                # Render a character that definitely doesn't exist (once per font)
+                missing_width = self._missing_glyph_width.get(font)
+                if missing_width is None:
+                    missing_char = font.render("\ue000", True, (255, 255, 255))  # Private use area
+                    missing_width = self._missing_glyph_width[font] = missing_char.get_width()
 
                 # If our character has the same width as the missing char and is very narrow,
                 # it's probably rendering as the same replacement glyph
@@ -308,26 +419,17 @@ class TextRenderer:
         regular_font = self._get_font(None, size)  # Default system font
 
         # Handle unicode font selection
-        if self.unicode_font_name and isinstance(self.unicode_font_name, dict):
-            # New format with supported character set
-            font_info = self.unicode_font_name
-            if font_info["name"] == "default":
-                unicode_font = regular_font
-            else:
-                unicode_font = self._get_font(font_info["name"], size)
-            supported_chars = font_info["supported_chars"]
-        elif self.unicode_font_name == "default":
-            # Legacy format - assume all characters work
-            unicode_font = regular_font
-            supported_chars = set(["►", "◄", "↑", "↓", "✓", "→", "←", "🐱", "🐈", "😸"])  # Assume basic set works
-        elif self.unicode_font_name:
-            # Legacy named font
-            unicode_font = self._get_font(self.unicode_font_name, size)
-            supported_chars = set(["►", "◄", "↑", "↓", "✓", "→", "←"])  # Conservative assumption
-        else:
+        info = self.font_info
+        if info is None:
             # No Unicode support available
             unicode_font = None
-            supported_chars = set()
+            supported_chars = _NO_CHARS
+        elif info.name == "default":
+            unicode_font = regular_font
+            supported_chars = info.supported_chars
+        else:
+            unicode_font = self._get_font(info.name, size)
+            supported_chars = info.supported_chars
 
         return regular_font, unicode_font, supported_chars
 
@@ -441,7 +543,7 @@ class TextRenderer:
                             y_off = 0
                         else:
                             y_off = regular_metrics - unicode_metrics
-                            if char in ["►", "◄", "↑", "↓", "→", "←"]:
+                            if char in _ARROW_CHARS:
                                 y_off += abs(regular_font.get_height() - char_surface.get_height()) // 4
                     except Exception:
                         char_surface = regular_font.render(self._get_ascii_fallback(char), True, color)
@@ -477,7 +579,7 @@ class TextRenderer:
         """Calculate the total width of text with mixed fonts."""
         total_width = 0
         if supported_chars is None:
-            supported_chars = set()
+            supported_chars = _NO_CHARS
 
         for char in text:
             if ord(char) > 127 and unicode_font and char in supported_chars:
@@ -570,145 +672,72 @@ class TextRenderer:
         Returns:
             pygame.Rect of the rendered character area
         """
-        # Use whitelist approach instead of tofu detection
-        if self.unicode_font_name:
-            if isinstance(self.unicode_font_name, dict):
-                # New format with supported character set
-                font_info = self.unicode_font_name
-                ### print(f"Trying to render Unicode char '{char}' with font '{font_info['name']}'")
-                ### print(f"Character in whitelist: {char in font_info['supported_chars']}")
-                if char in font_info["supported_chars"]:
-                    try:
-                        if font_info["name"] == "default":
-                            font = self._get_font(None, size)
-                        else:
-                            font = self._get_font(font_info["name"], size)
-
-                        # Character is known to work, render it
-                        char_surface = font.render(char, True, color)
-                        ### print(f"Successfully rendered Unicode char '{char}' with size {char_surface.get_width()}x{char_surface.get_height()}")  # noqa: E501
-
-                        # Calculate vertical alignment adjustment for better centering
-                        regular_font = self._get_font(None, size)
-                        if font != regular_font:
-                            # Different fonts - adjust for baseline differences
-                            regular_metrics = regular_font.get_ascent()
-                            unicode_metrics = font.get_ascent()
-                            baseline_adjustment = regular_metrics - unicode_metrics
-
-                            # For arrows and symbols, apply a subtle centering adjustment
-                            if char in ["►", "◄", "↑", "↓", "→", "←"]:
-                                # Small vertical adjustment for better alignment with text baseline
-                                char_height = char_surface.get_height()
-                                regular_height = regular_font.get_height()
-                                # Use a smaller fraction for more subtle adjustment
-                                vertical_center_adjustment = abs(regular_height - char_height) // 4  ###
-                                baseline_adjustment += vertical_center_adjustment
-                        else:
-                            baseline_adjustment = 0
-
-                        if center:
-                            rect = char_surface.get_rect(center=position)
-                            rect.y += baseline_adjustment
-                            surface.blit(char_surface, rect)
-                            return rect
-                        else:
-                            adjusted_position = (
-                                position[0],
-                                position[1] + baseline_adjustment,
-                            )
-                            surface.blit(char_surface, adjusted_position)
-                            return pygame.Rect(
-                                adjusted_position[0],
-                                adjusted_position[1],
-                                char_surface.get_width(),
-                                char_surface.get_height(),
-                            )
-                    except Exception:
-                        ### print(f"Exception rendering Unicode char '{char}': {e}")
-                        pass
-            else:
-                # Legacy format - try to render but be conservative
-                try:
-                    if self.unicode_font_name == "default":
-                        font = self._get_font(None, size)
-                    else:
-                        font = self._get_font(self.unicode_font_name, size)
-
-                    # Only try common symbols in legacy mode
-                    if char in ["►", "◄", "↑", "↓", "✓", "→", "←"]:
-                        char_surface = font.render(char, True, color)
-
-                        # Apply baseline adjustment for legacy mode too
-                        regular_font = self._get_font(None, size)
-                        if font != regular_font:
-                            regular_metrics = regular_font.get_ascent()
-                            unicode_metrics = font.get_ascent()
-                            baseline_adjustment = regular_metrics - unicode_metrics
-
-                            if char in ["►", "◄", "↑", "↓", "→", "←"]:
-                                char_height = char_surface.get_height()
-                                regular_height = regular_font.get_height()
-                                # Use a smaller fraction for more subtle adjustment
-                                vertical_center_adjustment = abs(regular_height - char_height) // 4  ###
-                                baseline_adjustment += vertical_center_adjustment
-                        else:
-                            baseline_adjustment = 0
-
-                        if center:
-                            rect = char_surface.get_rect(center=position)
-                            rect.y += baseline_adjustment
-                            surface.blit(char_surface, rect)
-                            return rect
-                        else:
-                            adjusted_position = (
-                                position[0],
-                                position[1] + baseline_adjustment,
-                            )
-                            surface.blit(char_surface, adjusted_position)
-                            return pygame.Rect(
-                                adjusted_position[0],
-                                adjusted_position[1],
-                                char_surface.get_width(),
-                                char_surface.get_height(),
-                            )
-                except Exception:
-                    pass
-
-        # Fall back to ASCII
-        fallback = fallback_char or self._get_ascii_fallback(char)
-        regular_font = self._get_font(None, size)
-        char_surface = regular_font.render(fallback, True, color)
+        char_surface, baseline_adjustment = self._rasterize_unicode_char(char, size, color, fallback_char)
 
         if center:
             rect = char_surface.get_rect(center=position)
+            rect.y += baseline_adjustment
             surface.blit(char_surface, rect)
             return rect
         else:
-            surface.blit(char_surface, position)
-            return pygame.Rect(
+            adjusted_position = (
                 position[0],
-                position[1],
+                position[1] + baseline_adjustment,
+            )
+            surface.blit(char_surface, adjusted_position)
+            return pygame.Rect(
+                adjusted_position[0],
+                adjusted_position[1],
                 char_surface.get_width(),
                 char_surface.get_height(),
             )
 
+    def _rasterize_unicode_char(self, char, size, color, fallback_char):
+        """The glyph render_unicode_char places: ``(glyph surface, baseline_adjustment)``,
+        from the Unicode font when it covers `char`, else the ASCII fallback (adjustment 0)."""
+        # Use whitelist approach instead of tofu detection
+        info = self.font_info
+        if info is not None and char in info.supported_chars:
+            try:
+                font = self._get_font(None if info.name == "default" else info.name, size)
+
+                # Character is known to work, render it
+                char_surface = font.render(char, True, color)
+
+                # Calculate vertical alignment adjustment for better centering
+                regular_font = self._get_font(None, size)
+                if font != regular_font:
+                    # Different fonts - adjust for baseline differences
+                    regular_metrics = regular_font.get_ascent()
+                    unicode_metrics = font.get_ascent()
+                    baseline_adjustment = regular_metrics - unicode_metrics
+
+                    # For arrows and symbols, apply a subtle centering adjustment
+                    if char in _ARROW_CHARS:
+                        # Small vertical adjustment for better alignment with text baseline
+                        char_height = char_surface.get_height()
+                        regular_height = regular_font.get_height()
+                        # Use a smaller fraction for more subtle adjustment
+                        vertical_center_adjustment = abs(regular_height - char_height) // 4  ###
+                        baseline_adjustment += vertical_center_adjustment
+                else:
+                    baseline_adjustment = 0
+
+                return char_surface, baseline_adjustment
+            except Exception:
+                ### print(f"Exception rendering Unicode char '{char}': {e}")
+                pass
+
+        # Fall back to ASCII
+        fallback = fallback_char or self._get_ascii_fallback(char)
+        regular_font = self._get_font(None, size)
+        char_surface = regular_font.render(fallback, True, color)
+
+        return char_surface, 0
+
     def _get_ascii_fallback(self, unicode_char):
         """Get ASCII fallback for common Unicode characters."""
-        fallbacks = {
-            "►": ">",
-            "▶": ">",  # U+25B6, the black-triangle twin of ► (#547)
-            "◄": "<",
-            "↑": "^",
-            "↓": "v",
-            "→": ">",
-            "←": "<",
-            "✓": "OK",
-            "✗": "X",
-            "☑": "[v]",
-            "☐": "[ ]",
-        }
-        return fallbacks.get(unicode_char, "?")
+        return _ASCII_FALLBACKS.get(unicode_char, "?")
 
 
 # Global text renderer instance
@@ -768,13 +797,14 @@ def quick_unicode_test():
     test_chars = ["►", "◄", "↑", "↓", "✓"]
 
     # Test the actual font being used
-    if text_renderer.unicode_font_name == "default":
+    info = text_renderer.font_info
+    if info is not None and info.name == "default":
         font = pygame.font.Font(None, TEXT_PROBE_SIZE)
         print("Using default font for Unicode")
-    elif text_renderer.unicode_font_name:
+    elif info is not None:
         try:
-            font = pygame.font.SysFont(text_renderer.unicode_font_name, TEXT_PROBE_SIZE)
-            print(f"Using named font: {text_renderer.unicode_font_name}")
+            font = pygame.font.SysFont(info.name, TEXT_PROBE_SIZE)
+            print(f"Using named font: {info.name}")
         except Exception:
             font = pygame.font.Font(None, TEXT_PROBE_SIZE)
             print("Named font failed, using default")
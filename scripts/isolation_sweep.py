@@ -16,6 +16,12 @@ pytest exits 5 ("no tests collected") — that is NOT an isolation failure. The
 tripped by this (the orphan ``test_air_dodge_shield_physics.py``; its removal is routed
 through #1237), so exit-5 is classified as ``empty`` and never counts as a failure.
 
+**Parallel** (``--jobs N``, ``make test-isolated ARGS="-j 8"``): the files are independent
+processes, and most of each one's wall-clock is interpreter + pygame start-up, so N of them
+run at once on a thread pool. Each child's output is captured and printed as one block when
+it finishes; results are still reported in sorted file order. ``-j 0`` uses one job per
+CPU. Default is 1 (sequential, output streamed live).
+
 **Shuffle mode** (``--shuffle``, ``make test-shuffle``): run the *whole* suite together under
 ``pytest-randomly`` for one or more seeds, catching inter-test *order*-dependence rather than
 single-file isolation. This dimension needs ``pytest-randomly`` (added by #1258); the per-file
@@ -28,8 +34,10 @@ work sits behind ``main()`` and the helper functions.
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # pytest's documented exit codes we care about.
@@ -59,9 +67,12 @@ def classify_exit(code: int) -> str:
     return "fail"
 
 
-def run_file(test_file: Path) -> int:
+def run_file(test_file: Path, capture: bool = False) -> int:
     """Run one test file alone in a fresh pytest process; return its exit code.
 
+    With ``capture`` the child's output is collected and printed in one block once it
+    exits, so parallel runs (``--jobs``) don't interleave their output line by line.
+
     Uses ``sys.executable`` so the child runs under the same interpreter/venv as the
     sweep. The default plugin set is left intact — in particular ``pytest-randomly`` stays
     active, so a test that asserts on its own plugin environment (e.g.
@@ -71,19 +82,38 @@ def run_file(test_file: Path) -> int:
     here — and doing so would falsely redden a plugin-environment assertion.
     """
     args = [sys.executable, "-m", "pytest", "-q", str(test_file)]
-    return subprocess.run(args, check=False).returncode
+    if not capture:
+        return subprocess.run(args, check=False).returncode
+    proc = subprocess.run(args, check=False, capture_output=True, text=True)
+    print(proc.stdout + proc.stderr, end="", flush=True)
+    return proc.returncode
+
 
+def resolve_jobs(jobs: int) -> int:
+    """``--jobs`` as a worker count: 0 means one per CPU, anything else is used as-is."""
+    return jobs if jobs > 0 else os.cpu_count() or 1
 
-def sweep_per_file(tests_dir: Path, pattern: str = "test_*.py") -> tuple[list[tuple[Path, str, int]], bool]:
+
+def sweep_per_file(
+    tests_dir: Path, pattern: str = "test_*.py", jobs: int = 1
+) -> tuple[list[tuple[Path, str, int]], bool]:
     """Run every matching test file alone; return ``(results, any_failed)``.
 
     ``results`` is ``(path, status, exit_code)`` per file, in sweep order. ``any_failed``
     is True iff at least one file classified as ``fail`` (``empty`` never counts).
+    ``jobs`` > 1 runs that many files at once (each still in its own process); 0 runs
+    one per CPU.
     """
+    files = iter_test_files(tests_dir, pattern)
+    jobs = resolve_jobs(jobs)
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            codes = list(pool.map(lambda f: run_file(f, capture=True), files))
+    else:
+        codes = [run_file(f) for f in files]
     results: list[tuple[Path, str, int]] = []
     any_failed = False
-    for test_file in iter_test_files(tests_dir, pattern):
-        code = run_file(test_file)
+    for test_file, code in zip(files, codes):
         status = classify_exit(code)
         if status == "fail":
             any_failed = True
@@ -106,8 +136,8 @@ def run_shuffled_suite(tests_dir: Path, seed: int) -> int:
     return subprocess.run(args, check=False).returncode
 
 
-def _run_per_file(tests_dir: Path, pattern: str) -> int:
-    results, any_failed = sweep_per_file(tests_dir, pattern)
+def _run_per_file(tests_dir: Path, pattern: str, jobs: int = 1) -> int:
+    results, any_failed = sweep_per_file(tests_dir, pattern, jobs)
     passed = [r for r in results if r[1] == "pass"]
     empty = [r for r in results if r[1] == "empty"]
     failed = [r for r in results if r[1] == "fail"]
@@ -154,6 +184,13 @@ def main(argv: list[str] | None = None) -> int:
         help="directory of test_*.py files to sweep (default: repo tests/)",
     )
     parser.add_argument("--pattern", default="test_*.py", help="glob for test files (default: test_*.py)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="per-file sweep: run this many files at once; 0 = one per CPU (default: 1, sequential)",
+    )
     parser.add_argument(
         "--shuffle",
         action="store_true",
@@ -172,7 +209,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.shuffle:
         seeds = args.seeds if args.seeds else list(_DEFAULT_SEEDS)
         return _run_shuffle(tests_dir, seeds)
-    return _run_per_file(tests_dir, args.pattern)
+    return _run_per_file(tests_dir, args.pattern, args.jobs)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ golden util is duplicated — so a shared version would be speculative dead code
 
 import pygame
 
+from pycats.core.input import InputFrame
 from pycats.entities.platform import Platform
 from pycats.entities.player import Player
 
@@ -44,6 +45,17 @@ P2 = dict(
     shield=pygame.K_COMMA,
 )
 
+# Six-key map of the dodge tests (shield on Q). One shared dict: Player keeps a
+# reference to its controls and never writes to it.
+DODGE_CONTROLS = dict(
+    left=pygame.K_a,
+    right=pygame.K_d,
+    up=pygame.K_w,
+    down=pygame.K_s,
+    shield=pygame.K_q,
+    attack=pygame.K_e,
+)
+
 # The canonical hand-rolled colours (orange body, black eyes) every _mk_player used.
 _COLOR = (255, 160, 64)
 _EYE = (0, 0, 0)
@@ -78,3 +90,9 @@ def advance(player, frames, *args, **kwargs):
     for _ in range(frames):
         player.update(*args, **kwargs)
     return player
+
+
+def frame(held=(), pressed=(), released=()):
+    """A fresh ``InputFrame`` for these key sets (stored as frozensets). A module that
+    replays one input binds it once at module scope, like the dodge tests' IDLE."""
+    return InputFrame(frozenset(held), frozenset(pressed), frozenset(released))
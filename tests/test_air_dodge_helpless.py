@@ -9,25 +9,17 @@ this file pins the helpless state machine + the SET (not add) semantics.
 """
 
 import pygame as pg
+from helpers import DODGE_CONTROLS as CONTROLS
+from helpers import frame as _frame
 
 from pycats.config import DODGE_AIR_SPEED, DODGE_TIME, P1_COLOR, WHITE
-from pycats.core.input import InputFrame
 from pycats.entities.platform import Platform
 from pycats.entities.player import Player
 
-CONTROLS = {
-    "left": pg.K_a,
-    "right": pg.K_d,
-    "up": pg.K_w,
-    "down": pg.K_s,
-    "shield": pg.K_q,
-    "attack": pg.K_e,
-}
 SHIELD, RIGHT, LEFT, UP, ATTACK = pg.K_q, pg.K_d, pg.K_a, pg.K_w, pg.K_e
 
 
-def _frame(held, pressed):
-    return InputFrame(held=set(held), pressed=set(pressed), released=set())
+_SETTLE = _frame((), ())  # no keys — fall / drift frames
 
 
 def _high_airborne(floor_y=2000):
@@ -37,13 +29,22 @@ def _high_airborne(floor_y=2000):
     plats.add(Platform(pg.Rect(0, floor_y, 960, 40), thin=False))
     p = Player(x=300, y=100, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="AirCat", facing_right=True)
     for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_SETTLE, plats)
     assert not p.fighter.on_ground, "fixture precondition: airborne"
     return p, plats
 
 
 def _air_dodge(p, plats, keys=(SHIELD,)):
-    p.update(_frame(set(keys), set(keys)), plats, pg.sprite.Group())
+    p.update(_frame(keys, keys), plats)
+
+
+def _tick_out_of_dodge(p, plats):
+    """Tick no-key frames until the dodge state ends, at most DODGE_TIME + 2 frames.
+    Stops on the exit frame instead of always running the full bound."""
+    for _ in range(DODGE_TIME + 2):
+        p.update(_SETTLE, plats)
+        if p.state != "dodge":
+            break
 
 
 def test_directional_air_dodge_sets_burst_not_adds():
@@ -64,19 +65,17 @@ def test_directional_air_dodge_sets_burst_not_adds():
 def test_air_dodge_enters_helpless_after_timer():
     p, plats = _high_airborne()
     _air_dodge(p, plats)
-    for _ in range(DODGE_TIME + 2):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    _tick_out_of_dodge(p, plats)
     assert p.state == "helpless", f"expected helpless after the dodge window, got {p.state!r}"
 
 
 def test_helpless_blocks_jump_and_does_not_consume_a_jump():
     p, plats = _high_airborne()
     _air_dodge(p, plats)
-    for _ in range(DODGE_TIME + 2):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    _tick_out_of_dodge(p, plats)
     assert p.state == "helpless"
     jumps_before = p.fighter.jumps_remaining
-    p.update(_frame({UP}, {UP}), plats, pg.sprite.Group())
+    p.update(_frame({UP}, {UP}), plats)
     assert p.state == "helpless", "jump must be locked out during helpless"
     assert p.fighter.jumps_remaining == jumps_before, "helpless must not consume a jump"
 
@@ -84,10 +83,9 @@ def test_helpless_blocks_jump_and_does_not_consume_a_jump():
 def test_helpless_blocks_attack():
     p, plats = _high_airborne()
     _air_dodge(p, plats)
-    for _ in range(DODGE_TIME + 2):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    _tick_out_of_dodge(p, plats)
     assert p.state == "helpless"
-    p.update(_frame({ATTACK}, {ATTACK}), plats, pg.sprite.Group())
+    p.update(_frame({ATTACK}, {ATTACK}), plats)
     assert p.state == "helpless", "attack must be locked out during helpless"
 
 
@@ -96,7 +94,7 @@ def test_helpless_recovers_to_idle_on_landing():
     _air_dodge(p, plats)
     landed_state = None
     for _ in range(180):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_SETTLE, plats)
         if p.fighter.on_ground:
             landed_state = p.state
             break
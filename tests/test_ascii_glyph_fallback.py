@@ -16,7 +16,7 @@ render_text_simple replace chain) and the glyph falls back to "?"/tofu → red.
 
 import pygame  # noqa: E402
 
-from pycats.ui.text_utils import TextRenderer  # noqa: E402
+from pycats.ui.text_utils import FontInfo, TextRenderer  # noqa: E402
 
 # glyph -> the legible ASCII stand-in it must degrade to (#547 Should table;
 # ✓ stays "OK" — a confirmation marker, so "P1 ✓" -> "P1 OK", never "P1 x").
@@ -93,3 +93,19 @@ def test_get_ascii_fallback_maps_the_should_table():
     tr = _tr()
     for glyph, ascii_sub in SUBSTITUTIONS.items():
         assert tr._get_ascii_fallback(glyph) == ascii_sub, f"{glyph!r} map entry"
+
+
+def test_font_info_tracks_every_stored_form():
+    """Assigning unicode_font_name (any stored form) re-derives the FontInfo the
+    render paths read, so the degraded paths above see the assigned config."""
+    tr = _tr()
+    tr.unicode_font_name = {"name": "dejavusans", "supported_chars": {"►"}}
+    assert tr.font_info == FontInfo("dejavusans", {"►"})
+    assert isinstance(tr.font_info.supported_chars, frozenset)  # frozen once, at assignment
+    tr.unicode_font_name = None
+    assert tr.font_info is None
+    tr.unicode_font_name = "default"  # legacy bare name: basic set + emoji
+    assert tr.font_info.name == "default" and {"►", "✓", "🐱"} <= tr.font_info.supported_chars
+    tr.unicode_font_name = "arial"  # legacy named font: basic set only
+    assert tr.font_info.name == "arial" and "►" in tr.font_info.supported_chars
+    assert "🐱" not in tr.font_info.supported_chars
@@ -122,7 +122,7 @@ def test_up_b_ends_in_helpless():
     # blast zone — step through the full move (floor at y=2000 → still airborne at end).
     saw_helpless = False
     for _ in range(48):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
         if p.state == "helpless":
             saw_helpless = True
             break
@@ -257,7 +257,7 @@ def test_up_b_plunges_downward_at_apex():
     prev = p.fighter.vel.y
     max_down_step = 0.0
     for _ in range(44):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
         max_down_step = max(max_down_step, p.fighter.vel.y - prev)
         prev = p.fighter.vel.y
     assert max_down_step > 5.0, (
@@ -282,7 +282,7 @@ def test_up_b_shockwave_spawns_on_touchdown_and_routes_landing_lag():
         fighter_data=load_fighter_data("birky"),
     )
     for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     atks = pg.sprite.Group()
     _up_b(p, plats, atks)
     saw_landing_lag = False
@@ -0,0 +1,69 @@
+"""Char-select render caches — per-selector surfaces/data built once, reused every frame.
+
+The roster grid's tile fills + borders are pre-stamped onto one backdrop surface and
+blitted in a single call, instead of two ``draw.rect`` calls per tile per frame. The
+roster is fixed for a selector's lifetime, so the backdrop never goes stale. Each tile's
+default-Skin palette is likewise resolved once, parallel to ``characters``.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from pycats.characters.roster import palette_for  # noqa: E402
+from pycats.config import (  # noqa: E402
+    CHAR_SELECT_BG_COLOR,
+    CHAR_SELECT_TILE_SIZE,
+    CHAR_SELECT_TILE_SPACING,
+    WHITE,
+)
+from pycats.screens.char_select import TILE_BG_COLOR, CharacterSelector  # noqa: E402
+
+_P1 = {"left": 1, "right": 2, "up": 3, "down": 4, "attack": 5, "special": 6}
+_P2 = {"left": 11, "right": 12, "up": 13, "down": 14, "attack": 15, "special": 16}
+
+
+def _sel():
+    pygame.init()
+    return CharacterSelector(_P1, _P2)
+
+
+def test_grid_backdrop_is_built_once_and_reused():
+    sel = _sel()
+    screen = pygame.Surface((960, 540))
+    sel.render(screen)
+    first = sel._grid_backdrop()
+    sel.render(screen)
+    assert sel._grid_backdrop() is first
+
+
+def test_backdrop_paints_tile_fill_border_and_background_gap():
+    sel = _sel()
+    screen = pygame.Surface((960, 540))
+    sel.render(screen)
+    x, y = sel._grid_pos_to_screen_pos(0)
+    assert screen.get_at((x, y))[:3] == WHITE  # 1px border corner
+    assert screen.get_at((x + 2, y + 2))[:3] == TILE_BG_COLOR  # fill, clear of the cat preview
+    # the spacing gap right of tile 0 stays the screen background
+    gap_x = x + CHAR_SELECT_TILE_SIZE + CHAR_SELECT_TILE_SPACING // 2
+    assert screen.get_at((gap_x, y + CHAR_SELECT_TILE_SIZE // 2))[:3] == CHAR_SELECT_BG_COLOR
+
+
+def test_tile_palettes_are_resolved_once_in_roster_order():
+    sel = _sel()
+    assert sel._char_data == [palette_for(k) for k in sel.characters]
+
+
+def test_tile_preview_paints_the_cached_palette():
+    # Able-to-fail: red if render re-resolves tile palettes per frame instead of reading
+    # the cache — swap the cached entry and the tile body must follow it.
+    sel = _sel()
+    sel._char_data[0] = palette_for("void")
+    screen = pygame.Surface((960, 540))
+    sel.render(screen)
+    x, y = sel._grid_pos_to_screen_pos(0)
+    body = screen.get_at((x + CHAR_SELECT_TILE_SIZE // 2, y + CHAR_SELECT_TILE_SIZE // 2))[:3]
+    assert body in {tuple(palette_for("void")["color"]), tuple(palette_for("void")["stripe_color"])}
@@ -0,0 +1,43 @@
+"""Char-select `CharacterSelector` declares a fixed `__slots__` attribute set.
+
+The render path reads cursor / grid-origin / confirm state off `self` many times per
+frame; with `__slots__` those are slot-offset loads and no per-instance `__dict__` is
+allocated. A stray attribute assignment (a typo, or a new field missing from the slot
+list) now raises instead of silently growing the instance.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from pycats.screens.char_select import CharacterSelector  # noqa: E402
+
+_P1 = {"left": 1, "right": 2, "up": 3, "down": 4, "attack": 5, "special": 6}
+_P2 = {"left": 11, "right": 12, "up": 13, "down": 14, "attack": 15, "special": 16}
+
+
+def _sel():
+    pygame.init()
+    return CharacterSelector(_P1, _P2)
+
+
+def test_selector_has_no_instance_dict():
+    assert not hasattr(_sel(), "__dict__")
+
+
+def test_undeclared_attribute_is_rejected():
+    sel = _sel()
+    with pytest.raises(AttributeError):
+        sel.p1_curser = 3  # typo of p1_cursor — must not silently create a new field
+
+
+def test_reset_and_render_only_touch_declared_slots():
+    # Able-to-fail: red if __init__/reset/render assign a field missing from __slots__.
+    sel = _sel()
+    sel.reset()
+    sel.update(set(), {_P1["attack"]})
+    sel.render(pygame.Surface((960, 540)))
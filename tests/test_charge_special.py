@@ -59,7 +59,7 @@ def _mk(fighter_data):
 
 
 def _step(p, plats, **kw):
-    p.update(_frame(**kw), plats, pg.sprite.Group())
+    p.update(_frame(**kw), plats)
 
 
 # ---- a chargeable special charges on the special button ---------------------
@@ -156,7 +156,7 @@ def test_smash_still_charges_on_the_smash_button():
     p = Player(100, 100, P1, (255, 160, 64), eye_color=(0, 0, 0), char_name="nalio", facing_right=True)
     plats = _ground()
     for _ in range(3):
-        p.update(_frame(), plats, pg.sprite.Group())
+        p.update(_frame(), plats)
     _step(p, plats, held=("smash", "right"), pressed=("smash", "right"))
     assert p.state == "charge"
     assert p.fighter.charge_button == "smash"
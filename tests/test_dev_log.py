@@ -87,7 +87,7 @@ def _airborne_default():
     plats.add(Platform(pg.Rect(0, 2000, 960, 40), thin=False))
     p = Player(x=300, y=100, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="P1", facing_right=True)
     for _ in range(3):
-        p.update(_frame(set()), plats, pg.sprite.Group())
+        p.update(_frame(set()), plats)
     return p, plats
 
 
@@ -96,7 +96,7 @@ def test_undefined_special_logs_when_enabled(tmp_path, monkeypatch):
     define → the input no-ops in play but leaves a breadcrumb when the flag is on."""
     log = _enable(monkeypatch, tmp_path)
     p, plats = _airborne_default()
-    p.update(_frame({pg.K_c}), plats, pg.sprite.Group())  # neutral + special
+    p.update(_frame({pg.K_c}), plats)  # neutral + special
     assert log.exists(), "an undefined special should leave a breadcrumb when enabled"
     assert MSG_CORE in log.read_text()
     assert "neutral_b" in log.read_text()
@@ -107,5 +107,5 @@ def test_undefined_special_silent_when_disabled(tmp_path, monkeypatch):
     monkeypatch.setenv("PYCATS_DEV_LOG_PATH", str(tmp_path / "LOGS.txt"))
     dev_log.reset()
     p, plats = _airborne_default()
-    p.update(_frame({pg.K_c}), plats, pg.sprite.Group())
+    p.update(_frame({pg.K_c}), plats)
     assert not (tmp_path / "LOGS.txt").exists(), "OFF → the sim/golden path writes nothing"
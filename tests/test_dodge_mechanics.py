@@ -17,25 +17,25 @@ Two dodge families:
 """
 
 import pygame as pg
+from helpers import DODGE_CONTROLS as CONTROLS
+from helpers import frame as _frame
 
 from pycats.config import DODGE_AIR_SPEED, DODGE_SPEED, DODGE_TIME, P1_COLOR, WHITE
-from pycats.core.input import InputFrame
 from pycats.entities.platform import Platform
 from pycats.entities.player import Player
 
-CONTROLS = {
-    "left": pg.K_a,
-    "right": pg.K_d,
-    "up": pg.K_w,
-    "down": pg.K_s,
-    "shield": pg.K_q,
-    "attack": pg.K_e,
-}
 LEFT, RIGHT, DOWN, SHIELD = pg.K_a, pg.K_d, pg.K_s, pg.K_q
 
 
-def _frame(held, pressed):
-    return InputFrame(held=set(held), pressed=set(pressed), released=set())
+# Scenario frames (interned by helpers.frame), shared by every test as static data.
+IDLE = _frame((), ())  # no keys — settle / fall frames
+SPOT_DODGE = _frame({SHIELD, DOWN}, {SHIELD, DOWN})
+SPOT_HOLD = _frame({SHIELD, DOWN}, ())
+DODGE_NEUTRAL = _frame({SHIELD}, {SHIELD})
+DODGE_RIGHT = _frame({SHIELD, RIGHT}, {SHIELD, RIGHT})
+DODGE_LEFT = _frame({SHIELD, LEFT}, {SHIELD, LEFT})
+ROLL_RIGHT_HOLD = _frame({SHIELD, RIGHT}, ())
+ROLL_LEFT_HOLD = _frame({SHIELD, LEFT}, ())
 
 
 def _grounded_player(plat_rect, thin):
@@ -51,7 +51,7 @@ def _grounded_player(plat_rect, thin):
         char_name="DodgeCat",
         facing_right=True,
     )
-    p.update(_frame(set(), set()), plats, pg.sprite.Group())  # settle on ground
+    p.update(IDLE, plats)  # settle on ground
     return p, plats
 
 
@@ -60,8 +60,7 @@ def _airborne_player():
     plats = pg.sprite.Group()
     plats.add(Platform(pg.Rect(100, 500, 600, 40), thin=False))
     p = Player(x=300, y=200, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="AirCat", facing_right=True)
-    for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    p.update_n(IDLE, plats, 3)
     assert not p.fighter.on_ground, "fixture precondition: player should be airborne"
     return p, plats
 
@@ -78,9 +77,9 @@ def test_spot_dodge_on_thin_platform_does_not_fall_through():
     so it genuinely exercises the no-gravity special physics."""
     p, plats = _grounded_player((300, 400, 200, 20), thin=True)
     settled_y = p.rect.y
-    p.update(_frame({SHIELD, DOWN}, {SHIELD, DOWN}), plats, pg.sprite.Group())
+    p.update(SPOT_DODGE, plats)
     for _ in range(DODGE_TIME + 1):
-        p.update(_frame({SHIELD, DOWN}, set()), plats, pg.sprite.Group())
+        p.update(SPOT_HOLD, plats)
         assert p.fighter.on_ground, "spot dodge left the ground (started falling through)"
         assert p.rect.y == settled_y, f"player dropped from y={settled_y} to y={p.rect.y}"
 
@@ -88,10 +87,9 @@ def test_spot_dodge_on_thin_platform_does_not_fall_through():
 def test_spot_dodge_returns_to_shield_while_shield_held():
     """After the dodge window, with shield still held, the player is shielding."""
     p, plats = _grounded_player((600, 400, 200, 20), thin=False)
-    p.update(_frame({SHIELD, DOWN}, {SHIELD, DOWN}), plats, pg.sprite.Group())
+    p.update(SPOT_DODGE, plats)
     assert p.state == "dodge" and p.fighter.spot_dodge_shield_held
-    for _ in range(DODGE_TIME + 1):
-        p.update(_frame({SHIELD, DOWN}, set()), plats, pg.sprite.Group())
+    p.update_n(SPOT_HOLD, plats, DODGE_TIME + 1)
     assert p.state == "shield", f"expected return to shield, got {p.state!r}"
 
 
@@ -100,14 +98,14 @@ def test_spot_dodge_returns_to_shield_while_shield_held():
 
 def test_right_air_dodge_applies_positive_dodge_speed():
     p, plats = _airborne_player()
-    p.update(_frame({SHIELD, RIGHT}, {SHIELD, RIGHT}), plats, pg.sprite.Group())
+    p.update(DODGE_RIGHT, plats)
     assert p.state == "dodge"
     assert p.fighter.vel.x == DODGE_AIR_SPEED, f"expected +{DODGE_AIR_SPEED}, got {p.fighter.vel.x}"
 
 
 def test_left_air_dodge_applies_negative_dodge_speed():
     p, plats = _airborne_player()
-    p.update(_frame({SHIELD, LEFT}, {SHIELD, LEFT}), plats, pg.sprite.Group())
+    p.update(DODGE_LEFT, plats)
     assert p.state == "dodge"
     assert p.fighter.vel.x == -DODGE_AIR_SPEED, f"expected -{DODGE_AIR_SPEED}, got {p.fighter.vel.x}"
 
@@ -116,7 +114,7 @@ def test_neutral_air_dodge_adds_no_horizontal_velocity():
     """Shield-only air dodge from a standstill imparts no horizontal velocity."""
     p, plats = _airborne_player()
     assert p.fighter.vel.x == 0
-    p.update(_frame({SHIELD}, {SHIELD}), plats, pg.sprite.Group())
+    p.update(DODGE_NEUTRAL, plats)
     assert p.state == "dodge"
     assert p.fighter.vel.x == 0, f"neutral air dodge imparted vel.x={p.fighter.vel.x}"
 
@@ -127,7 +125,7 @@ def test_neutral_air_dodge_halts_existing_horizontal_momentum():
     test_neutral_air_dodge_preserves_existing_horizontal_momentum.)"""
     p, plats = _airborne_player()
     p.fighter.vel.x = 8.0
-    p.update(_frame({SHIELD}, {SHIELD}), plats, pg.sprite.Group())
+    p.update(DODGE_NEUTRAL, plats)
     assert p.fighter.vel.x == 0, f"neutral air dodge should halt momentum: vel.x={p.fighter.vel.x}"
 
 
@@ -139,14 +137,14 @@ def test_air_dodge_halts_vertical_velocity():
     p, plats = _airborne_player()
     vy_before = p.fighter.vel.y
     assert vy_before > 0
-    p.update(_frame({SHIELD, RIGHT}, {SHIELD, RIGHT}), plats, pg.sprite.Group())
+    p.update(DODGE_RIGHT, plats)
     assert p.fighter.vel.y < vy_before, f"air dodge should halt vel.y below {vy_before}, got {p.fighter.vel.y}"
 
 
 def test_air_dodge_is_not_a_ground_spot_dodge():
     """An air dodge must not raise the ground-spot-dodge flag."""
     p, plats = _airborne_player()
-    p.update(_frame({SHIELD, RIGHT}, {SHIELD, RIGHT}), plats, pg.sprite.Group())
+    p.update(DODGE_RIGHT, plats)
     assert p.state == "dodge"
     assert p.fighter.spot_dodge_shield_held is False
 
@@ -155,7 +153,7 @@ def test_air_dodge_consumes_air_dodge_ok():
     """An air dodge spends the one available air dodge (air_dodge_ok True -> False)."""
     p, plats = _airborne_player()
     assert p.fighter.air_dodge_ok is True
-    p.update(_frame({SHIELD, RIGHT}, {SHIELD, RIGHT}), plats, pg.sprite.Group())
+    p.update(DODGE_RIGHT, plats)
     assert p.fighter.air_dodge_ok is False
 
 
@@ -166,14 +164,16 @@ def test_ground_side_dodge_rolls_at_full_dodge_speed():
     """A grounded side dodge (shield+direction) rolls at the full DODGE_SPEED for
     the whole window — not half speed/distance (`test_dodge_issues` / `test_left_right_dodge`)."""
     p, plats = _grounded_player((100, 400, 700, 40), thin=False)
-    assert p.fighter.on_ground
+    # Only the Fighter is aliased: update() rebinds p.rect and fighter.vel each tick.
+    fighter = p.fighter
+    assert fighter.on_ground
     start_x = p.rect.centerx
-    p.update(_frame({SHIELD, RIGHT}, {SHIELD, RIGHT}), plats, pg.sprite.Group())
+    p.update(DODGE_RIGHT, plats)
     assert p.state == "dodge"
-    speeds = [p.fighter.vel.x]
+    speeds = [fighter.vel.x]
     for _ in range(DODGE_TIME - 1):
-        p.update(_frame({SHIELD, RIGHT}, set()), plats, pg.sprite.Group())
-        speeds.append(p.fighter.vel.x)
+        p.update(ROLL_RIGHT_HOLD, plats)
+        speeds.append(fighter.vel.x)
     moving = [s for s in speeds if s != 0]
     assert moving and all(s == DODGE_SPEED for s in moving), f"roll not at full speed: {speeds}"
     assert p.rect.centerx - start_x == DODGE_SPEED * DODGE_TIME, "roll distance is not full"
@@ -181,18 +181,29 @@ def test_ground_side_dodge_rolls_at_full_dodge_speed():
 
 def test_ground_side_dodge_left_mirrors_right_at_full_speed():
     """Left ground roll is the mirror of right — full -DODGE_SPEED, full distance.
-    Ports the left-vs-right symmetry intent of `test_left_right_dodge`."""
-    p, plats = _grounded_player((100, 400, 700, 40), thin=False)
-    assert p.fighter.on_ground
-    start_x = p.rect.centerx
-    p.update(_frame({SHIELD, LEFT}, {SHIELD, LEFT}), plats, pg.sprite.Group())
-    assert p.state == "dodge"
-    speeds = [p.fighter.vel.x]
+    Ports the left-vs-right symmetry intent of `test_left_right_dodge`. Both rolls
+    step in lockstep through one frame loop, so the left roll's per-frame speeds
+    are checked against the right roll's, not just against the constant."""
+    rolls = ((DODGE_RIGHT, ROLL_RIGHT_HOLD), (DODGE_LEFT, ROLL_LEFT_HOLD))
+    seats = [_grounded_player((100, 400, 700, 40), thin=False) for _ in rolls]
+    starts = [p.rect.centerx for p, _ in seats]
+    # Per-seat (player, platforms, hold frame, Fighter, trace), unpacked once. Only the
+    # Fighter is aliased: update() rebinds p.rect and fighter.vel each tick.
+    lanes = [(p, plats, hold, p.fighter, []) for (p, plats), (_, hold) in zip(seats, rolls)]
+    for (p, plats, _, fighter, trace), (press, _) in zip(lanes, rolls):
+        assert fighter.on_ground
+        p.update(press, plats)
+        assert p.state == "dodge"
+        trace.append(fighter.vel.x)
     for _ in range(DODGE_TIME - 1):
-        p.update(_frame({SHIELD, LEFT}, set()), plats, pg.sprite.Group())
-        speeds.append(p.fighter.vel.x)
-    moving = [s for s in speeds if s != 0]
-    assert moving and all(s == -DODGE_SPEED for s in moving), f"left roll not full speed: {speeds}"
+        for p, plats, hold, fighter, trace in lanes:
+            p.update(hold, plats)
+            trace.append(fighter.vel.x)
+    right, left = (trace for *_, trace in lanes)
+    assert left == [-s for s in right], f"left roll is not the mirror of right: {left} vs {right}"
+    moving = [s for s in left if s != 0]
+    assert moving and all(s == -DODGE_SPEED for s in moving), f"left roll not full speed: {left}"
+    (p, _), start_x = seats[1], starts[1]
     assert start_x - p.rect.centerx == DODGE_SPEED * DODGE_TIME, "left roll distance is not full"
 
 
@@ -209,7 +220,56 @@ def test_shield_then_direction_air_dodge_is_neutral():
     direction to apply velocity; whether shield-then-direction *should* redirect is
     a separate design question, not current behavior.)"""
     p, plats = _airborne_player()
-    p.update(_frame({SHIELD}, {SHIELD}), plats, pg.sprite.Group())  # shield first
-    p.update(_frame({SHIELD, RIGHT}, {RIGHT}), plats, pg.sprite.Group())  # then direction
+    p.update(DODGE_NEUTRAL, plats)  # shield first
+    p.update(_frame({SHIELD, RIGHT}, {RIGHT}), plats)  # then direction
     assert p.state == "dodge"
     assert p.fighter.vel.x == 0, f"shield-then-direction redirected to vel.x={p.fighter.vel.x} (was neutral)"
+
+
+# --------------------------------------------------------- batched ticking
+
+
+def test_update_n_matches_n_single_updates():
+    """`Player.update_n` is a loop over `update`, not a shortcut: after a held roll it
+    lands on the same position / velocity / state as ticking one frame at a time."""
+    a, plats_a = _grounded_player((100, 400, 700, 40), thin=False)
+    b, plats_b = _grounded_player((100, 400, 700, 40), thin=False)
+    a.update(DODGE_RIGHT, plats_a)
+    b.update(DODGE_RIGHT, plats_b)
+    for _ in range(DODGE_TIME):
+        a.update(ROLL_RIGHT_HOLD, plats_a)
+    b.update_n(ROLL_RIGHT_HOLD, plats_b, DODGE_TIME)
+    assert (b.rect.center, b.fighter.vel.x, b.state) == (a.rect.center, a.fighter.vel.x, a.state)
+
+
+def test_reset_reuses_one_player_across_dodge_scenarios():
+    """`Player.reset(x, y)` lets one Player replay several dodge scenarios: after a
+    right roll, a reset + left roll lands exactly where a freshly built player's
+    left roll does, in the same state."""
+    plat_rect = (100, 400, 700, 40)
+    x, y = plat_rect[0] + plat_rect[2] // 2, plat_rect[1]
+    pooled, plats = _grounded_player(plat_rect, thin=False)
+    pooled.update(DODGE_RIGHT, plats)
+    pooled.update_n(ROLL_RIGHT_HOLD, plats, DODGE_TIME)
+    pooled.reset(x, y)
+    assert (pooled.state, pooled.fighter.dodge_timer, pooled.fighter.vel.x) == ("idle", 0, 0)
+    pooled.update(IDLE, plats)  # settle on ground, as _grounded_player does
+
+    fresh, fresh_plats = _grounded_player(plat_rect, thin=False)
+    for p, ps in ((pooled, plats), (fresh, fresh_plats)):
+        p.update(DODGE_LEFT, ps)
+        p.update_n(ROLL_LEFT_HOLD, ps, DODGE_TIME - 1)
+    got = (pooled.rect.center, pooled.fighter.vel.x, pooled.state)
+    assert got == (fresh.rect.center, fresh.fighter.vel.x, fresh.state)
+
+
+def test_snap_to_ground_matches_a_settle_frame():
+    """`Player.snap_to_ground` stands the fighter where one real settle frame lands it:
+    same feet, grounded, idle, jumps and air dodge restored."""
+    settled, plats = _grounded_player((100, 400, 700, 40), thin=False)
+    snapped = Player(x=450, y=400, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="DodgeCat")
+    assert snapped.snap_to_ground(plats)
+    for p in (settled, snapped):
+        f = p.fighter
+        assert (p.rect.bottom, f.on_ground, p.state) == (400, True, "idle")
+        assert (f.jumps_remaining, f.air_dodge_ok) == (f.max_jumps, True)
@@ -0,0 +1,80 @@
+"""Persisted Unicode-font detection result (font_detect_cache).
+
+All tests redirect the config dir to a tmp_path via PYCATS_CONFIG_DIR, so they
+never read or write the real ~/.config/pycats file.
+"""
+
+import pygame
+
+from pycats.storage import font_detect_cache
+from pycats.ui.text_utils import TextRenderer
+
+_FOUND = {"name": "dejavusans", "supported_chars": {"►", "◄", "✓"}}
+
+
+def test_save_then_load_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    key = font_detect_cache.fonts_key(["dejavusans", "arial"], 20)
+    font_detect_cache.save(key, _FOUND)
+    assert font_detect_cache.load(key) == (True, _FOUND)
+
+
+def test_no_font_found_is_a_cached_hit(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    font_detect_cache.save("k", None)
+    assert font_detect_cache.load("k") == (True, None)
+
+
+def test_changed_font_list_misses(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    font_detect_cache.save(font_detect_cache.fonts_key(["arial"], 20), _FOUND)
+    assert font_detect_cache.load(font_detect_cache.fonts_key(["arial", "unifont"], 20)) == (False, None)
+
+
+def test_key_is_order_independent_and_stable():
+    # hashlib digest, not hash(): a sha256 hex string, identical across processes.
+    a = font_detect_cache.fonts_key(["b", "a"], 20)
+    assert a == font_detect_cache.fonts_key(["a", "b"], 20)
+    assert len(a) == 64 and a != font_detect_cache.fonts_key(["a", "b"], 24)
+
+
+def test_corrupt_file_misses(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "font_detect.json").write_text("{ not json")
+    assert font_detect_cache.load("k") == (False, None)  # no crash
+
+
+def test_unwritable_config_dir_is_a_miss_not_a_crash(tmp_path, monkeypatch):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(not_a_dir))
+    font_detect_cache.save("k", _FOUND)  # makedirs under a file -> NotADirectoryError, swallowed
+    assert font_detect_cache.load("k") == (False, None)
+
+
+def test_no_persist_neither_reads_nor_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setenv("PYCATS_NO_PERSIST", "1")
+    font_detect_cache.save("k", _FOUND)
+    assert not (tmp_path / "cache").exists()
+    assert font_detect_cache.load("k") == (False, None)
+
+
+def test_persisting_renderer_skips_the_probe_sweep_on_a_warm_cache(tmp_path, monkeypatch):
+    """Able-to-fail: red if a persisting TextRenderer re-runs _find_unicode_font when
+    the saved result's key still matches, or if a default TextRenderer reads the cache."""
+    monkeypatch.setenv("PYCATS_CONFIG_DIR", str(tmp_path))
+    pygame.font.init()
+    calls = []
+
+    def _probe(self):
+        calls.append(self)
+        return _FOUND
+
+    monkeypatch.setattr(TextRenderer, "_find_unicode_font", _probe)
+    assert TextRenderer(persist_detection=True).unicode_font_name == _FOUND  # cold: probes + saves
+    assert TextRenderer(persist_detection=True).unicode_font_name == _FOUND  # warm: cache hit
+    assert len(calls) == 1
+    assert TextRenderer().unicode_font_name == _FOUND  # non-persisting (tests, tools): always probes
+    assert len(calls) == 2
@@ -1,4 +1,5 @@
 # tests/test_input_script.py
+import pytest
 from helpers import P1, P2
 
 from pycats.core.input import InputFrame
@@ -31,3 +32,11 @@ def test_release_edge_after_span_end():
     frames = compile_timeline([InputSpan(0, 1, 1, "right"), InputSpan(2, 3, 1, "left")], [P1, P2])
     assert P1["right"] in frames[1].released
     assert P1["right"] not in frames[1].held
+
+
+def test_input_frame_is_slotted():
+    # Able-to-fail: red if InputFrame regains a per-instance __dict__ (slots dropped).
+    fr = compile_timeline([InputSpan(0, 1, 1, "right")], [P1, P2])[0]
+    assert not hasattr(fr, "__dict__")
+    with pytest.raises(AttributeError):
+        fr.buffered = {P1["right"]}  # undeclared field must not silently attach
@@ -78,3 +78,29 @@ def test_iter_test_files_matches_pattern(tmp_path):
 
     found = [p.name for p in sweep.iter_test_files(tmp_path)]
     assert found == ["test_a.py", "test_b.py"]
+
+
+def test_parallel_sweep_matches_sequential(tmp_path):
+    """``jobs`` > 1 runs files concurrently but reports the same statuses, in the same
+    sorted order, as the sequential sweep."""
+    _write(tmp_path, "test_a_ok.py", "def test_ok():\n    assert True\n")
+    _write(tmp_path, "test_b_red.py", "def test_bad():\n    assert False\n")
+    _write(tmp_path, "test_c_empty.py", "X = 1\n")
+
+    sequential = sweep.sweep_per_file(tmp_path)
+    parallel = sweep.sweep_per_file(tmp_path, jobs=3)
+
+    assert parallel == sequential
+    assert [(path.name, st) for path, st, _code in parallel[0]] == [
+        ("test_a_ok.py", "pass"),
+        ("test_b_red.py", "fail"),
+        ("test_c_empty.py", "empty"),
+    ]
+
+
+def test_zero_jobs_means_one_per_cpu(monkeypatch):
+    monkeypatch.setattr(sweep.os, "cpu_count", lambda: 6)
+    assert sweep.resolve_jobs(0) == 6
+    assert sweep.resolve_jobs(3) == 3
+    monkeypatch.setattr(sweep.os, "cpu_count", lambda: None)  # undeterminable -> sequential
+    assert sweep.resolve_jobs(0) == 1
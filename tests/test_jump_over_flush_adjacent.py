@@ -46,7 +46,7 @@ def _flush_pair():
 def _step(players, plats, held, pressed):
     fi = InputFrame(held=set(held), pressed=set(pressed), released=set())
     for p in players:
-        p.update(fi, plats, pg.sprite.Group())
+        p.update(fi, plats)
     resolve_player_push(players, plats)
 
 
@@ -102,7 +102,7 @@ def _nalio_on_floor():
         fighter_data=load_fighter_data("nalio"),
     )
     for _ in range(8):  # settle / land on the floor
-        p.update(_frame(), plats, pg.sprite.Group())
+        p.update(_frame(), plats)
     assert p.fighter.on_ground, "fixture: Nalio should be grounded"
     return p, plats
 
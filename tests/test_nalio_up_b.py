@@ -93,7 +93,7 @@ def test_up_b_ends_in_helpless():
     _up_b(p, plats)
     # move total = 2 + 13 + 23 = 38; step well past it, still airborne (high floor)
     for _ in range(50):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert p.state == "helpless", f"recovery move should end in helpless, got {p.state!r}"
 
 
@@ -44,12 +44,12 @@ def _mk():
     p = Player(100, 100, P1, (48, 48, 96), eye_color=(0, 0, 0), char_name="narz", facing_right=True)
     plats = _ground()
     for _ in range(3):  # settle onto the ground
-        p.update(_frame(), plats, pg.sprite.Group())
+        p.update(_frame(), plats)
     return p, plats
 
 
 def _step(p, plats, **kw):
-    p.update(_frame(**kw), plats, pg.sprite.Group())
+    p.update(_frame(**kw), plats)
 
 
 def _fire_and_get_attack(p, plats, hold_frames):
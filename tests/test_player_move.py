@@ -27,7 +27,7 @@ def _noop():
 def _settle_grounded(p, platforms):
     # Run a couple of no-op frames so the player rests on the platform.
     for _ in range(3):
-        p.update(_noop(), platforms, pygame.sprite.Group())
+        p.update(_noop(), platforms)
 
 
 def test_attack_press_sets_current_move_and_zero_frame():
@@ -20,7 +20,7 @@ def test_render_battle_draws_without_error():
 
     empty = InputFrame(held=set(), pressed=set(), released=set())
     for p in players:
-        p.update(empty, platforms, pygame.sprite.Group())
+        p.update(empty, platforms)
     render_battle(surface, players, platforms)  # must not raise
     assert surface.get_at((0, 0)) is not None
 
@@ -44,7 +44,7 @@ def _settle():
     empty = InputFrame(set(), set(), set())
     for _ in range(10):
         for p in players:
-            p.update(empty, platforms, pygame.sprite.Group())
+            p.update(empty, platforms)
     return players, platforms
 
 
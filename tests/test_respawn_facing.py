@@ -39,14 +39,14 @@ def test_respawn_restores_initial_facing(initial_facing_right):
 
     # Force a KO by driving the player out the bottom blast zone, via the real loop.
     p.rect = p.rect.with_top(SCREEN_HEIGHT + 9999)
-    p.update(_noop(), platforms, pygame.sprite.Group())
+    p.update(_noop(), platforms)
     assert not p.fighter.is_alive, "precondition: player should be KO'd"
     # Facing is untouched while dead/waiting; the reset happens on respawn.
     assert p.fighter.facing_right == (not initial_facing_right)
 
     # Tick through the respawn delay; _respawn fires from update().
     for _ in range(RESPAWN_DELAY_FRAMES + 2):
-        p.update(_noop(), platforms, pygame.sprite.Group())
+        p.update(_noop(), platforms)
 
     assert p.fighter.is_alive, "player should have respawned"
     assert p.fighter.facing_right == initial_facing_right, (
@@ -34,7 +34,7 @@ def test_respawn_clears_transient_action_state():
 
     # Force a KO out the bottom blast zone via the real loop.
     p.rect = p.rect.with_top(SCREEN_HEIGHT + 9999)
-    p.update(_noop(), platforms, pygame.sprite.Group())
+    p.update(_noop(), platforms)
     assert not p.fighter.is_alive, "precondition: player should be KO'd"
 
     # _ko() early-returns, so transient action state set mid-dodge/mid-attack is
@@ -58,7 +58,7 @@ def test_respawn_clears_transient_action_state():
     for _ in range(RESPAWN_DELAY_FRAMES + 5):
         if p.fighter.is_alive:
             break
-        p.update(_noop(), platforms, pygame.sprite.Group())
+        p.update(_noop(), platforms)
     assert p.fighter.is_alive, "player should have respawned"
 
     assert p.fighter.dodge_timer == 0
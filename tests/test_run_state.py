@@ -47,12 +47,12 @@ def _grounded_player():
     plats = pg.sprite.Group()
     plats.add(Platform(pg.Rect(0, 400, 800, 40), thin=False))
     p = Player(x=400, y=400, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="DashCat", facing_right=True)
-    p.update(_frame(set(), set()), plats, pg.sprite.Group())  # settle on ground
+    p.update(_frame(set(), set()), plats)  # settle on ground
     return p, plats
 
 
 def _step(p, plats, held=(), pressed=()):
-    p.update(_frame(held, pressed), plats, pg.sprite.Group())
+    p.update(_frame(held, pressed), plats)
 
 
 def _hold(p, plats, key, frames):
@@ -70,7 +70,7 @@ def test_holding_shield_until_drained_to_zero_breaks_it():
     plats = pg.sprite.Group(Platform(pg.Rect(0, 160, 400, 40), thin=False))
     noop = InputFrame(held=set(), pressed=set(), released=set())
     for _ in range(30):  # settle until grounded (falls ~16f)
-        p.update(noop, plats, pg.sprite.Group())
+        p.update(noop, plats)
         if p.fighter.on_ground:
             break
     assert p.fighter.on_ground, "fighter never landed to shield from"
@@ -79,7 +79,7 @@ def test_holding_shield_until_drained_to_zero_breaks_it():
     hold_shield = InputFrame(held={pg.K_x}, pressed=set(), released=set())
     broke = False
     for _ in range(12):
-        p.update(hold_shield, plats, pg.sprite.Group())
+        p.update(hold_shield, plats)
         if p.fighter.stun_timer > 0:
             broke = True
             break
@@ -161,11 +161,11 @@ def test_all_inputs_locked_while_stunned():
     # settle on ground
     noop = InputFrame(held=set(), pressed=set(), released=set())
     for _ in range(5):
-        p.update(noop, plats, pg.sprite.Group())
+        p.update(noop, plats)
     p.fighter._start_stun()  # break the shield -> dizzy
     x0 = p.rect.x
     held_right = InputFrame(held={pg.K_d}, pressed={pg.K_d, pg.K_v, pg.K_w}, released=set())
     for _ in range(10):
-        p.update(held_right, plats, pg.sprite.Group())
+        p.update(held_right, plats)
     assert p.rect.x == x0, "stunned fighter moved despite locked inputs"
     assert p.fighter.jumps_remaining == 2, "stunned fighter jumped despite locked inputs"
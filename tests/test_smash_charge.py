@@ -39,7 +39,7 @@ def _mk(char="nalio"):
 
 
 def _step(p, plats, **kw):
-    p.update(_frame(**kw), plats, pg.sprite.Group())
+    p.update(_frame(**kw), plats)
 
 
 # ---- schema -----------------------------------------------------------------
@@ -10,21 +10,15 @@ shield state instead of triggering a spot dodge.
 """
 
 import pygame as pg
+from helpers import DODGE_CONTROLS as CONTROLS
+from helpers import frame as _frame
 
 from pycats.config import P1_COLOR, WHITE
-from pycats.core.input import InputFrame
 from pycats.entities.platform import Platform
 from pycats.entities.player import Player
 
-CONTROLS = {
-    "left": pg.K_a,
-    "right": pg.K_d,
-    "up": pg.K_w,
-    "down": pg.K_s,
-    "shield": pg.K_q,
-    "attack": pg.K_e,
-}
 DOWN, SHIELD = pg.K_s, pg.K_q
+_SETTLE = _frame()  # no keys — land on the platform
 
 
 def _make_player():
@@ -33,34 +27,30 @@ def _make_player():
     p = Player(
         x=700, y=400, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="OrderCat", facing_right=True
     )
-    p.update(InputFrame(held=set(), pressed=set(), released=set()), platforms, pg.sprite.Group())  # settle on ground
+    p.update(_SETTLE, platforms)  # settle on ground
     return p, platforms
 
 
-def _frame(held, pressed):
-    return InputFrame(held=set(held), pressed=set(pressed), released=set())
-
-
 def _is_ground_spot_dodge(p):
     return p.fighter.dodge_timer > 0 and p.state == "dodge" and p.fighter.spot_dodge_shield_held
 
 
 def test_simultaneous_down_shield_spot_dodges():
     p, plats = _make_player()
-    p.update(_frame({DOWN, SHIELD}, {DOWN, SHIELD}), plats, pg.sprite.Group())
+    p.update(_frame({DOWN, SHIELD}, {DOWN, SHIELD}), plats)
     assert _is_ground_spot_dodge(p)
 
 
 def test_shield_first_then_down_spot_dodges():
     p, plats = _make_player()
-    p.update(_frame({SHIELD}, {SHIELD}), plats, pg.sprite.Group())  # shield first
-    p.update(_frame({SHIELD, DOWN}, {DOWN}), plats, pg.sprite.Group())  # then down
+    p.update(_frame({SHIELD}, {SHIELD}), plats)  # shield first
+    p.update(_frame({SHIELD, DOWN}, {DOWN}), plats)  # then down
     assert _is_ground_spot_dodge(p)
 
 
 def test_down_first_then_shield_spot_dodges():
     """The #6 regression: down held, then shield pressed."""
     p, plats = _make_player()
-    p.update(_frame({DOWN}, {DOWN}), plats, pg.sprite.Group())  # down first
-    p.update(_frame({DOWN, SHIELD}, {SHIELD}), plats, pg.sprite.Group())  # then shield
+    p.update(_frame({DOWN}, {DOWN}), plats)  # down first
+    p.update(_frame({DOWN, SHIELD}, {SHIELD}), plats)  # then shield
     assert _is_ground_spot_dodge(p)
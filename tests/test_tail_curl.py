@@ -39,7 +39,7 @@ def test_curl_on_lifts_the_tail(monkeypatch):
     for _ in range(300):
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
     base, tip = p.tail.segments[0], p.tail.segments[-1]
     assert tip.y - base.y < 0  # curled up, not hanging down
 
@@ -50,7 +50,7 @@ def test_curl_off_falls_back_to_pure_hang(monkeypatch):
     for _ in range(300):
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
     base, tip = p.tail.segments[0], p.tail.segments[-1]
     assert tip.y - base.y > 20  # pure gravity hang: tip well below base
 
@@ -61,12 +61,12 @@ def test_undulation_keeps_the_idle_tail_moving():
     for _ in range(200):  # reach steady undulation
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
     xs = []
     for _ in range(120):  # ~2s
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
         xs.append(p.tail.segments[-1].x)
     # tip keeps travelling a continuous lateral range (well above the disabled
     # ~0 baseline below); exact magnitude is a tunable feel value.
@@ -79,11 +79,11 @@ def test_no_undulation_when_disabled(monkeypatch):
     for _ in range(200):
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
     xs = []
     for _ in range(120):
         p.rect = p.rect.with_midbottom((460, 300))
         p.fighter.vel.update(0, 0)
-        p.update(_e(), far, pg.sprite.Group())
+        p.update(_e(), far)
         xs.append(p.tail.segments[-1].x)
     assert max(xs) - min(xs) < 1.0  # settled, no continuous motion
@@ -40,7 +40,7 @@ def test_gravity_droop_is_substantial_and_stable():
     for f in range(1, 401):
         p.rect = p.rect.with_midbottom((460, 300))  # pin so it settles without falling away
         p.fighter.vel.update(0, 0)
-        p.update(_empty(), far, pg.sprite.Group())
+        p.update(_empty(), far)
         if f in (200, 400):
             base, tip = p.tail.segments[0], p.tail.segments[-1]
             droop[f] = tip.y - base.y
@@ -55,7 +55,7 @@ def test_strong_droop_does_not_clip_below_thick_platform():
     plats = pg.sprite.Group()
     plats.add(plat)
     p = Player(x=460, y=360, controls=C, color=P1_COLOR, eye_color=WHITE, char_name="Cat", facing_right=True)
-    p.update(_empty(), plats, pg.sprite.Group())  # sets p.platforms
+    p.update(_empty(), plats)  # sets p.platforms
     seg = p.tail.segments[10]
     seg.x, seg.y = 460, plat.rect.bottom + 12  # 12px BELOW the whole platform
     p.tail._resolve_platform_collisions(plats)
@@ -34,7 +34,7 @@ def _max_move_over(p, plats, frames):
     prev = [(s.x, s.y) for s in p.tail.segments]
     worst = 0.0
     for _ in range(frames):
-        p.update(_e(), plats, pg.sprite.Group())
+        p.update(_e(), plats)
         cur = [(s.x, s.y) for s in p.tail.segments]
         worst = max(worst, max(math.hypot(c[0] - q[0], c[1] - q[1]) for q, c in zip(prev, cur)))
         prev = cur
@@ -51,15 +51,15 @@ def test_tail_reinitializes_on_respawn_like_first_load():
     g = _stage()
     p = Player(x=460, y=360, controls=C, color=P1_COLOR, eye_color=WHITE, char_name="Cat", facing_right=True)
     for _ in range(120):
-        p.update(_e(), g, pg.sprite.Group())
+        p.update(_e(), g)
     for _ in range(30):
         p.rect = p.rect.with_centerx(p.rect.centerx + (60))
-        p.update(_e(), g, pg.sprite.Group())
+        p.update(_e(), g)
         if not p.fighter.is_alive:
             break
     assert not p.fighter.is_alive  # we actually KO'd
     for _ in range(RESPAWN_DELAY_FRAMES + 1):
-        p.update(_e(), g, pg.sprite.Group())  # -> _respawn
+        p.update(_e(), g)  # -> _respawn
     respawn_max = _max_move_over(p, g, 30)
 
     # Post-respawn motion must look like a first load, not a big swing-in.
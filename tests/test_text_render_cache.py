@@ -87,6 +87,19 @@ def test_distinct_key_recomposes():
     assert tr.mixed_cache_misses == m + 2
 
 
+def test_reassigning_the_unicode_font_recomposes():
+    """Able-to-fail: red if a cached composition outlives a unicode_font_name change
+    (it was laid out with the old font / supported set)."""
+    tr = _tr()
+    tr.unicode_font_name = {"name": "default", "supported_chars": set()}
+    s = pygame.Surface((400, 80))
+    tr.render_text_mixed("Options ► ON", 24, (255, 0, 0), s, (200, 40))
+    m = tr.mixed_cache_misses
+    tr.unicode_font_name = {"name": "default", "supported_chars": {"►"}}
+    tr.render_text_mixed("Options ► ON", 24, (255, 0, 0), s, (200, 40))
+    assert tr.mixed_cache_misses == m + 1
+
+
 def test_cached_output_is_byte_identical_to_direct_blit():
     for txt, center in [("Use W/S or ↑/↓ to navigate", True), ("Options ► ON", True), ("Status Bars: ON", False)]:
         tr = _tr()
@@ -71,13 +71,13 @@ def _airborne(recovery_vx=0.0, floor_y=2000, facing_right=True):
         fighter_data=_recovery_fd(recovery_vx),
     )
     for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert not p.fighter.on_ground, "fixture precondition: airborne"
     return p, plats
 
 
 def _up_b(p, plats):
-    p.update(_frame({UP, SPECIAL}, {UP, SPECIAL}), plats, pg.sprite.Group())
+    p.update(_frame({UP, SPECIAL}, {UP, SPECIAL}), plats)
 
 
 def test_up_b_sets_upward_recovery_burst():
@@ -96,7 +96,7 @@ def test_up_b_move_ends_in_helpless():
     p, plats = _airborne()
     _up_b(p, plats)
     for _ in range(10):  # move total = 2+2+2 = 6; step past it, still airborne
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert p.state == "helpless", f"recovery move should end in helpless, got {p.state!r}"
 
 
@@ -104,7 +104,7 @@ def test_second_up_b_locked_during_helpless():
     p, plats = _airborne()
     _up_b(p, plats)
     for _ in range(10):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert p.state == "helpless"
     vy_before = p.fighter.vel.y  # falling under gravity in helpless
     _up_b(p, plats)  # try to recover again
@@ -127,7 +127,7 @@ def test_landing_from_recovery_clears_flag_and_idles():
     _up_b(p, plats)
     landed = None
     for _ in range(240):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
         if p.fighter.on_ground:
             landed = p.state
             break
@@ -84,13 +84,13 @@ def _airborne(facing_right=True, facing_vx=PLUNGE_VX):
         fighter_data=_plunge_fd(facing_vx),
     )
     for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert not p.fighter.on_ground, "fixture precondition: airborne"
     return p, plats
 
 
 def _up_b(p, plats):
-    p.update(_frame({UP, SPECIAL}, {UP, SPECIAL}), plats, pg.sprite.Group())
+    p.update(_frame({UP, SPECIAL}, {UP, SPECIAL}), plats)
 
 
 def _step_to_frame(p, plats, target):
@@ -98,7 +98,7 @@ def _step_to_frame(p, plats, target):
     for _ in range(60):
         if p.move_frame >= target:
             break
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     return p
 
 
@@ -155,7 +155,7 @@ def test_velocity_phase_suppressed_during_hitstun():
     p.fighter.hurt_timer = 20
     knockback_vy = -30.0
     p.fighter.vel.y = knockback_vy
-    p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    p.update(_frame(set(), set()), plats)
     assert p.move_frame == PLUNGE_FRAME
     assert p.fighter.vel.y != PLUNGE_VY, "plunge must not overwrite knockback velocity during hitstun"
 
@@ -51,7 +51,7 @@ def _grounded(plat_rect, spawn_x, thin=False):
         facing_right=True,
     )
     for _ in range(90):
-        p.update(_frame(), plats, pg.sprite.Group())
+        p.update(_frame(), plats)
         if p.fighter.on_ground:
             break
     assert p.fighter.on_ground, "fixture precondition: grounded"
@@ -61,7 +61,7 @@ def _grounded(plat_rect, spawn_x, thin=False):
 
 def _step_until_airborne(p, plats, held=(), max_frames=180):
     for _ in range(max_frames):
-        p.update(_frame(held=held), plats, pg.sprite.Group())
+        p.update(_frame(held=held), plats)
         if not p.fighter.on_ground:
             return
     raise AssertionError("fighter never left the ground within the window")
@@ -83,7 +83,7 @@ def test_jump_off_does_not_double_decrement():
     plat = pg.Rect(100, 400, 500, 40)
     p, plats = _grounded(plat, spawn_x=350)
     # press jump; step until airborne
-    p.update(_frame(held={UP}, pressed={UP}), plats, pg.sprite.Group())
+    p.update(_frame(held={UP}, pressed={UP}), plats)
     _step_until_airborne(p, plats)
     assert p.fighter.jumps_remaining == p.fighter.max_jumps - 1, (
         "jump-off must not double-decrement (jump press + clamp)"
@@ -124,7 +124,7 @@ def test_fresh_airborne_spawn_keeps_full_jumps():
     assert p.fighter.jumps_remaining == p.fighter.max_jumps, "fresh spawn keeps full jumps"
     # a couple of airborne frames must not erode the count (was_airborne stays True)
     for _ in range(3):
-        p.update(_frame(), plats, pg.sprite.Group())
+        p.update(_frame(), plats)
     assert p.fighter.jumps_remaining == p.fighter.max_jumps, (
         "airborne spawn must retain full jumps until it actually lands"
     )
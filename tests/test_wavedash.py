@@ -56,7 +56,7 @@ def _airborne(floor_y, x=300, y=100):
     plats.add(Platform(pg.Rect(0, floor_y, 960, 40), thin=False))
     p = Player(x=x, y=y, controls=CONTROLS, color=P1_COLOR, eye_color=WHITE, char_name="WaveCat", facing_right=True)
     for _ in range(3):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert not p.fighter.on_ground, "fixture precondition: airborne"
     return p, plats
 
@@ -64,7 +64,7 @@ def _airborne(floor_y, x=300, y=100):
 def _step_until_landed(p, plats, max_frames=120):
     """Idle-step until the fighter touches ground; return the landing-frame state."""
     for _ in range(max_frames):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
         if p.fighter.on_ground:
             return p.state
     raise AssertionError("fighter never landed within the window")
@@ -73,7 +73,7 @@ def _step_until_landed(p, plats, max_frames=120):
 def test_diagonal_down_air_dodge_sets_angled_burst():
     """A shield+right+down air dodge sets velocity DOWN-and-right (angled), not flat."""
     p, plats = _airborne(floor_y=2000)  # lots of room: dodge plays out in the air
-    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats, pg.sprite.Group())
+    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats)
     assert p.state == "dodge"
     expected_vy = DODGE_AIR_SPEED * math.sin(math.radians(WAVEDASH_ANGLE_DEG))  # ≈ 4.1
     expected_vx = DODGE_AIR_SPEED * math.cos(math.radians(WAVEDASH_ANGLE_DEG))  # ≈ 13.4
@@ -94,18 +94,18 @@ def test_wavedash_produces_grounded_slide_that_decays():
     """Diagonal-down air dodge into the ground → a grounded horizontal slide whose
     speed decays each frame under ground friction (not an instant stop)."""
     p, plats = _airborne(floor_y=190)  # close floor: lands mid-dodge, momentum intact
-    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats, pg.sprite.Group())
+    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats)
     _step_until_landed(p, plats)
     assert p.fighter.on_ground
     slide0 = p.fighter.vel.x
     assert slide0 > 0.1, f"waveland should keep a forward slide, got vx={slide0}"
     # advance one frame: friction must bleed the slide, not zero it instantly
-    p.update(_frame(set(), set()), plats, pg.sprite.Group())
+    p.update(_frame(set(), set()), plats)
     slide1 = p.fighter.vel.x
     assert 0 < slide1 < slide0, f"slide should decay under friction: {slide0} -> {slide1}"
     # and eventually settle to a stop
     for _ in range(60):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert p.fighter.vel.x == 0, f"slide should settle to 0, got {p.fighter.vel.x}"
 
 
@@ -113,15 +113,15 @@ def test_waveland_locks_actions_for_landing_lag_then_recovers():
     """After a waveland the fighter is in landing-lag (actions locked) for the lag
     window, then recovers to idle. A jump during the lag is ignored."""
     p, plats = _airborne(floor_y=190)
-    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats, pg.sprite.Group())
+    p.update(_frame({SHIELD, RIGHT, DOWN}, {SHIELD, RIGHT, DOWN}), plats)
     landed_state = _step_until_landed(p, plats)
     assert landed_state == "landing_lag", f"landing from a wavedash should enter landing_lag, got {landed_state!r}"
     # a jump press during landing lag is ignored and consumes no jump
     jumps_before = p.fighter.jumps_remaining
-    p.update(_frame({UP}, {UP}), plats, pg.sprite.Group())
+    p.update(_frame({UP}, {UP}), plats)
     assert p.state == "landing_lag", "jump must be locked out during landing lag"
     assert p.fighter.jumps_remaining == jumps_before, "landing lag must not consume a jump"
     # within the lag window it recovers to idle
     for _ in range(WAVEDASH_LANDING_LAG + 2):
-        p.update(_frame(set(), set()), plats, pg.sprite.Group())
+        p.update(_frame(set(), set()), plats)
     assert p.state == "idle", f"should recover to idle after the lag window, got {p.state!r}"